@@ -0,0 +1,196 @@
+# src/ajustar_modelos.py
+# Ajuste de hiperparámetros de los modelos de clientes
+# Successive halving sobre el número de árboles: todos los candidatos
+# empiezan con pocos árboles, solo el mejor tercio sigue creciendo
+# (warm_start, sin reentrenar desde cero) hasta quedar uno, que crece hasta
+# ARBOLES_MAX. Del ganador se guarda el número de árboles con mejor AUC de
+# todos los que se evaluaron, para que modelo_sklearn.py lo use en la
+# corrida normal
+#
+# Requiere haber corrido antes modelo_sklearn.py, que deja en caché las
+# matrices de entrenamiento ya escaladas
+
+import json
+import os
+import time
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import StratifiedKFold, ParameterGrid, ParameterSampler
+
+# ── CONFIGURACIÓN ──────────────────────────────────
+CANDIDATOS   = int(os.environ.get("CANDIDATOS_AJUSTE", 16))
+FACTOR       = int(os.environ.get("FACTOR_AJUSTE", 3))
+ARBOLES_MIN  = int(os.environ.get("ARBOLES_MIN", 25))
+ARBOLES_MAX  = int(os.environ.get("ARBOLES_MAX", 400))
+PLIEGUES     = int(os.environ.get("PLIEGUES_AJUSTE", 3))
+HILOS_AJUSTE = int(os.environ.get("HILOS_AJUSTE", os.cpu_count() or 1))
+EMPATE       = 1e-4  # diferencia de AUC por debajo de la cual no hay ganador
+
+RUTA_MATRIZ          = "data/models/matriz_ajuste.joblib"
+RUTA_HIPERPARAMETROS = "data/models/hiperparametros.json"
+RUTA_HISTORIAL       = "data/outputs/ajuste_hiperparametros.csv"
+
+# Espacio de búsqueda de cada modelo (n_estimators es el presupuesto)
+MODELOS = {
+    "recurrente": (RandomForestClassifier, {
+        "max_depth"       : [None, 8, 16],
+        "min_samples_leaf": [1, 3, 10],
+        "max_features"    : ["sqrt", 0.5, None],
+    }),
+    "riesgo": (GradientBoostingClassifier, {
+        "learning_rate"   : [0.03, 0.1, 0.3],
+        "max_depth"       : [2, 3, 4],
+        "subsample"       : [0.7, 1.0],
+        "min_samples_leaf": [1, 5, 20],
+    }),
+}
+
+
+class Candidato:
+    """Una configuración con un modelo por pliegue que crece con warm_start."""
+
+    def __init__(self, clase, parametros, pliegues):
+        self.parametros = parametros
+        self.pliegues = pliegues
+        self.modelos = [
+            clase(**parametros, warm_start=True, random_state=42)
+            for _ in pliegues
+        ]
+        self.puntuacion = None
+        self.arboles = 0
+        self.por_arboles = {}  # AUC de cada presupuesto evaluado
+
+    def crecer(self, arboles):
+        """Agrega árboles hasta `arboles` y evalúa AUC medio en validación."""
+        if arboles == self.arboles:
+            return self  # ya evaluado con este presupuesto
+        self.arboles = arboles
+        notas = []
+        for modelo, (X_ent, y_ent, X_val, y_val) in zip(self.modelos, self.pliegues):
+            modelo.set_params(n_estimators=arboles)
+            modelo.fit(X_ent, y_ent)
+            notas.append(roc_auc_score(y_val, modelo.predict_proba(X_val)[:, 1]))
+        self.puntuacion = float(np.mean(notas))
+        self.por_arboles[arboles] = self.puntuacion
+        return self
+
+    def mejor_presupuesto(self):
+        """(árboles, AUC) del presupuesto con mejor AUC; en empate, el menor."""
+        return max(self.por_arboles.items(), key=lambda par: (par[1], -par[0]))
+
+
+def partir(X, y):
+    """Pliegues estratificados, copiados una sola vez para todos los candidatos."""
+    divisor = StratifiedKFold(n_splits=PLIEGUES, shuffle=True, random_state=42)
+    return [
+        (X[ent], y[ent], X[val], y[val])
+        for ent, val in divisor.split(X, y)
+    ]
+
+
+def successive_halving(nombre, clase, espacio, X, y):
+    """Devuelve (parámetros ganadores, AUC, empate, historial por ronda).
+
+    `empate` indica que en la última selección el mejor y el segundo
+    quedaron a menos de EMPATE de AUC: el ganador no es significativo.
+    """
+    pliegues = partir(X, y)
+    n = min(CANDIDATOS, len(ParameterGrid(espacio)))
+    vivos = [
+        Candidato(clase, p, pliegues)
+        for p in ParameterSampler(espacio, n_iter=n, random_state=42)
+    ]
+
+    historial = []
+    arboles = min(ARBOLES_MIN, ARBOLES_MAX)
+    empate = False
+    ronda = 0
+    # Hilos: los candidatos comparten los pliegues en memoria y el
+    # entrenamiento de los árboles libera el GIL
+    with Parallel(n_jobs=HILOS_AJUSTE, prefer="threads") as paralelo:
+        while True:
+            inicio = time.perf_counter()
+            paralelo(delayed(c.crecer)(arboles) for c in vivos)
+            vivos.sort(key=lambda c: c.puntuacion, reverse=True)
+
+            historial += [
+                {"modelo": nombre, "ronda": ronda, "arboles": arboles,
+                 "auc": round(c.puntuacion, 4), **c.parametros}
+                for c in vivos
+            ]
+            print(f"   Ronda {ronda}: {len(vivos):>2} candidatos × {arboles:>3} árboles "
+                  f"→ mejor AUC {vivos[0].puntuacion:.4f} "
+                  f"({time.perf_counter() - inicio:.1f} s)")
+
+            if len(vivos) == 1 and arboles >= ARBOLES_MAX:
+                break
+            if len(vivos) > 1:
+                empate = vivos[0].puntuacion - vivos[1].puntuacion < EMPATE
+                vivos = vivos[:max(1, len(vivos) // FACTOR)]
+                arboles = min(arboles * FACTOR, ARBOLES_MAX)
+            else:
+                # El ganador sigue creciendo con warm_start hasta el máximo
+                arboles = ARBOLES_MAX
+            ronda += 1
+
+    # n_estimators también se ajusta: con más árboles el boosting puede
+    # sobreajustar, así que se queda el presupuesto con mejor AUC
+    ganador = vivos[0]
+    mejores_arboles, auc = ganador.mejor_presupuesto()
+    print(f"   Mejor presupuesto del ganador: {mejores_arboles} árboles (AUC {auc:.4f})")
+    return {**ganador.parametros, "n_estimators": mejores_arboles}, auc, empate, historial
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("  AJUSTE DE HIPERPARÁMETROS — Successive halving")
+    print(f"  Candidatos: {CANDIDATOS} | Factor: {FACTOR} | "
+          f"Árboles: {ARBOLES_MIN}–{ARBOLES_MAX} | Hilos: {HILOS_AJUSTE}")
+    print("=" * 60)
+
+    if not os.path.exists(RUTA_MATRIZ):
+        raise SystemExit(f" Falta {RUTA_MATRIZ}: ejecuta antes python src/modelo_sklearn.py")
+    matriz = joblib.load(RUTA_MATRIZ, mmap_mode="r")
+
+    ganadores, historial = {}, []
+    for nombre, (clase, espacio) in MODELOS.items():
+        X, y = matriz[f"X_{nombre}"], matriz[f"y_{nombre}"]
+        print(f"\n {nombre} — {clase.__name__} ({len(X):,} clientes)")
+
+        if len(np.unique(y)) < 2 or np.bincount(y).min() < PLIEGUES:
+            print("   Muy pocos casos de alguna clase: se mantiene la configuración actual")
+            continue
+
+        parametros, auc, empate, rondas = successive_halving(nombre, clase, espacio, X, y)
+        historial += rondas
+        if empate:
+            print(f"   Empate en AUC ({auc:.4f}) entre los mejores candidatos: "
+                  "se mantiene la configuración actual")
+            continue
+        ganadores[nombre] = {
+            "modelo"    : clase.__name__,
+            "parametros": parametros,
+            "auc"       : round(auc, 4),
+        }
+        print(f"   Ganador: {parametros}")
+
+    pd.DataFrame(historial).to_csv(RUTA_HISTORIAL, index=False)
+
+    print("\n" + "=" * 60)
+    if ganadores:
+        # Se conservan las configuraciones de modelos no ajustados en esta corrida
+        if os.path.exists(RUTA_HIPERPARAMETROS):
+            with open(RUTA_HIPERPARAMETROS, encoding="utf-8") as f:
+                ganadores = {**json.load(f), **ganadores}
+        with open(RUTA_HIPERPARAMETROS, "w", encoding="utf-8") as f:
+            json.dump(ganadores, f, indent=2)
+        print(f"  Configuración guardada en {RUTA_HIPERPARAMETROS}")
+        print("  La próxima corrida de modelo_sklearn.py la usará")
+    else:
+        print(f"  Sin ganador claro: {RUTA_HIPERPARAMETROS} no se modifica")
+    print(f"  Historial de rondas en {RUTA_HISTORIAL}")
+    print("=" * 60)
@@ -0,0 +1,328 @@
+# src/almacen_features.py
+# Almacén persistente de variables por cliente
+# Guarda el perfil de cada cliente en arreglos mapeados en memoria para
+# actualizarlo con cada lote de ventas y leerlo sin recalcular
+
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Variables que consumen los modelos: en este orden y contiguas en disco,
+# así la matriz completa se lee como una vista sin copiar
+FEATURES = [
+    "total_gastado", "gasto_promedio", "gasto_maximo",
+    "num_compras", "producto_favorito", "mes_ultima_compra",
+    "dias_entre_compras", "dias_desde_ultima", "tipo_cliente_cod"
+]
+
+# Acumulados para actualizar sin releer el historial (fechas en segundos).
+# producto_favorito no se acumula: es la media del target encoding de los
+# productos comprados y ese encoding se recalcula sobre todo el historial en
+# cada corrida, así que se guarda cuántas veces compró cada producto
+# (conteos.npy) y se vuelve a calcular con el encoding vigente
+ACUMULADOS = ["primera_compra", "ultima_compra", "gasto_promedio_48h"]
+
+COLUMNAS = FEATURES + ACUMULADOS
+COL = {nombre: i for i, nombre in enumerate(COLUMNAS)}
+
+RUTA_ALMACEN     = "data/features"
+FECHA_REFERENCIA = "2024-12-31"
+SEGUNDOS_DIA     = 86_400
+
+# Columnas de la venta que entran en su huella: si cambian para un
+# venta_id ya incorporado, el historial fue reescrito
+COLUMNAS_HUELLA = ["venta_id", "cliente_id", "producto", "precio", "fecha_venta"]
+
+
+class HistorialModificado(ValueError):
+    """Ventas ya incorporadas que cambiaron o desaparecieron del historial."""
+
+
+def huellas(ventas):
+    """Hash de 64 bits de cada venta sobre COLUMNAS_HUELLA."""
+    columnas = [c for c in COLUMNAS_HUELLA if c in ventas.columns]
+    return pd.util.hash_pandas_object(ventas[columnas], index=False).to_numpy(np.uint64)
+
+
+class AlmacenFeatures:
+    """Perfil de clientes en disco con índice denso por cliente_id.
+
+    - datos.npy  : matriz (filas, COLUMNAS) en float64
+    - ids.npy    : cliente_id de cada fila
+    - indice.npy : fila de cada cliente_id (-1 si no existe)
+    - conteos.npy: compras de cada producto por fila (columnas en meta)
+    - ventas.npy : venta_id incorporados (ordenados) y la huella de cada uno
+    - meta.json  : filas usadas, ventas incorporadas, fecha de referencia y
+                   productos con el encoding con que se calculó producto_favorito
+
+    Los archivos se abren con memmap: consultar un cliente es O(1) y las
+    lecturas masivas son vistas del archivo.
+    """
+
+    def __init__(self, ruta=RUTA_ALMACEN, modo="r+"):
+        self.ruta = ruta
+        self.modo = modo
+        with open(f"{ruta}/meta.json", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self._abrir()
+
+    @classmethod
+    def crear(cls, ruta=RUTA_ALMACEN, capacidad=1024, fecha_referencia=FECHA_REFERENCIA):
+        os.makedirs(ruta, exist_ok=True)
+        np.save(f"{ruta}/datos.npy", np.zeros((capacidad, len(COLUMNAS))))
+        np.save(f"{ruta}/ids.npy", np.zeros(capacidad, dtype=np.int64))
+        np.save(f"{ruta}/indice.npy", np.full(capacidad + 1, -1, dtype=np.int64))
+        np.save(f"{ruta}/conteos.npy", np.zeros((capacidad, 0), dtype=np.int64))
+        np.save(f"{ruta}/ventas.npy", np.zeros((2, 0), dtype=np.uint64))
+        meta = {
+            "columnas"        : COLUMNAS,
+            "n_filas"         : 0,
+            "n_ventas"        : 0,
+            "fecha_referencia": fecha_referencia,
+            "productos"       : [],
+            "codificacion"    : [],
+        }
+        with open(f"{ruta}/meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        return cls(ruta)
+
+    @classmethod
+    def abrir_o_crear(cls, ruta=RUTA_ALMACEN, reconstruir=False):
+        # Almacenes de versiones anteriores (sin registro de ventas o sin
+        # conteos por producto) se rehacen
+        if (reconstruir or not os.path.exists(f"{ruta}/ventas.npy")
+                or not os.path.exists(f"{ruta}/conteos.npy")):
+            return cls.crear(ruta)
+        return cls(ruta)
+
+    def _abrir(self):
+        self.datos  = np.load(f"{self.ruta}/datos.npy", mmap_mode=self.modo)
+        self.ids    = np.load(f"{self.ruta}/ids.npy", mmap_mode=self.modo)
+        self.indice = np.load(f"{self.ruta}/indice.npy", mmap_mode=self.modo)
+        self.conteos = np.load(f"{self.ruta}/conteos.npy", mmap_mode=self.modo)
+        # Fila 0: venta_id, fila 1: huella (ambas uint64, por venta_id)
+        self.ventas = np.load(f"{self.ruta}/ventas.npy", mmap_mode=self.modo)
+
+    def _guardar_meta(self):
+        with open(f"{self.ruta}/meta.json", "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+
+    # ── LECTURA ────────────────────────────────────
+    @property
+    def n_filas(self):
+        return self.meta["n_filas"]
+
+    def clientes(self):
+        """cliente_id de cada fila (vista)."""
+        return self.ids[:self.n_filas]
+
+    def features(self, inicio=0, fin=None):
+        """Matriz (clientes, FEATURES) como vista del archivo, sin copiar."""
+        fin = self.n_filas if fin is None else min(fin, self.n_filas)
+        return self.datos[inicio:fin, :len(FEATURES)]
+
+    def columna(self, nombre):
+        return self.datos[:self.n_filas, COL[nombre]]
+
+    def filas(self, cliente_ids):
+        """Fila de cada cliente (-1 si no está) con un acceso directo por id."""
+        cliente_ids = np.asarray(cliente_ids, dtype=np.int64)
+        filas = np.full(len(cliente_ids), -1, dtype=np.int64)
+        dentro = (cliente_ids >= 0) & (cliente_ids < len(self.indice))
+        filas[dentro] = self.indice[cliente_ids[dentro]]
+        return filas
+
+    def consultar(self, cliente_id):
+        """Variables de un cliente como dict, o None si no existe."""
+        fila = self.filas([cliente_id])[0]
+        if fila < 0:
+            return None
+        return dict(zip(COLUMNAS, self.datos[fila].tolist()))
+
+    # ── ESCRITURA ──────────────────────────────────
+    def asignar(self, nombre, cliente_ids, valores):
+        """Escribe una columna para los clientes dados (p. ej. tipo_cliente_cod)."""
+        filas = self.filas(cliente_ids)
+        existe = filas >= 0
+        self.datos[filas[existe], COL[nombre]] = np.asarray(valores)[existe]
+        self.datos.flush()
+
+    def _ampliar(self, nombre, actual, forma, relleno):
+        temporal = f"{self.ruta}/{nombre}.tmp.npy"
+        nuevo = np.lib.format.open_memmap(temporal, mode="w+", dtype=actual.dtype, shape=forma)
+        nuevo[:] = relleno
+        nuevo[tuple(slice(0, n) for n in actual.shape)] = actual
+        nuevo.flush()
+        del nuevo
+        os.replace(temporal, f"{self.ruta}/{nombre}.npy")
+
+    def _reservar(self, filas_necesarias, max_id):
+        """Duplica la capacidad de los archivos hasta que quepan filas e ids."""
+        capacidad, capacidad_ids = len(self.ids), len(self.indice)
+        if filas_necesarias <= capacidad and max_id < capacidad_ids:
+            return
+        while capacidad < filas_necesarias:
+            capacidad *= 2
+        while capacidad_ids <= max_id:
+            capacidad_ids *= 2
+        self._ampliar("datos", self.datos, (capacidad, len(COLUMNAS)), 0.0)
+        self._ampliar("ids", self.ids, (capacidad,), 0)
+        self._ampliar("indice", self.indice, (capacidad_ids,), -1)
+        self._ampliar("conteos", self.conteos, (capacidad, self.conteos.shape[1]), 0)
+        self._abrir()
+
+    def _codificar(self, ventas):
+        """Registra los productos de `ventas` y su encoding vigente.
+
+        Devuelve True si cambió el encoding de algún producto ya registrado:
+        entonces producto_favorito de todos los clientes está desactualizado.
+        """
+        tabla = ventas.groupby("producto")["producto_encoded"].first()
+        productos = self.meta["productos"]
+        nuevos = [p for p in tabla.index if p not in productos]
+        if nuevos:
+            self._ampliar("conteos", self.conteos,
+                          (len(self.conteos), len(productos) + len(nuevos)), 0)
+            self._abrir()
+            productos += nuevos
+            self.meta["codificacion"] += [float(tabla[p]) for p in nuevos]
+
+        anterior = np.array(self.meta["codificacion"])
+        vigente = tabla.reindex(productos).fillna(pd.Series(anterior, index=productos))
+        self.meta["codificacion"] = vigente.astype(float).tolist()
+        return not np.array_equal(anterior, vigente.to_numpy(float))
+
+    def _separar_nuevas(self, ventas, completo):
+        """Máscara de ventas no incorporadas; verifica las ya incorporadas.
+
+        Una venta conocida con otra huella, o (con `completo=True`) una
+        venta incorporada que ya no está en `ventas`, lanza
+        HistorialModificado: el almacén no refleja esos datos.
+        """
+        ids = ventas["venta_id"].to_numpy(np.int64).astype(np.uint64)
+        if len(np.unique(ids)) != len(ids):
+            raise HistorialModificado("venta_id repetidos en el lote de ventas")
+        conocidos, huellas_conocidas = self.ventas[0], self.ventas[1]
+
+        pos = np.searchsorted(conocidos, ids).clip(max=max(len(conocidos) - 1, 0))
+        incorporada = (conocidos[pos] == ids) if len(conocidos) else np.zeros(len(ids), bool)
+
+        distintas = int((huellas(ventas)[incorporada] != huellas_conocidas[pos[incorporada]]).sum())
+        if distintas:
+            raise HistorialModificado(f"{distintas:,} ventas ya incorporadas cambiaron de datos")
+        faltan = len(conocidos) - int(incorporada.sum())
+        if completo and faltan:
+            raise HistorialModificado(f"{faltan:,} ventas incorporadas ya no están en el historial")
+        return ~incorporada
+
+    def _registrar_ventas(self, nuevas):
+        ids = np.concatenate([self.ventas[0], nuevas["venta_id"].to_numpy(np.int64).astype(np.uint64)])
+        hs  = np.concatenate([self.ventas[1], huellas(nuevas)])
+        orden = np.argsort(ids, kind="stable")
+        del self.ventas
+        np.save(f"{self.ruta}/ventas.tmp.npy", np.stack([ids[orden], hs[orden]]))
+        os.replace(f"{self.ruta}/ventas.tmp.npy", f"{self.ruta}/ventas.npy")
+        self.ventas = np.load(f"{self.ruta}/ventas.npy", mmap_mode=self.modo)
+        self.meta["n_ventas"] = len(ids)
+
+    def actualizar(self, ventas, completo=False):
+        """Incorpora un lote de ventas y recalcula solo los clientes tocados.
+
+        Se incorporan las ventas cuyo venta_id no está registrado, sin
+        importar su orden (una venta tardía o reparada de cuarentena con id
+        bajo también entra), así que volver a pasar el historial es seguro.
+        `completo=True` indica que `ventas` es el historial entero. Si el
+        historial fue reescrito lanza HistorialModificado y no toca nada.
+        Devuelve cuántas ventas se sumaron.
+        """
+        nuevas = ventas[self._separar_nuevas(ventas, completo)]
+        recodificado = self._codificar(ventas)
+        if nuevas.empty:
+            if recodificado:
+                self._recalcular_favorito(np.arange(self.n_filas))
+                self.datos.flush()
+                self._guardar_meta()
+            return 0
+
+        cids = nuevas["cliente_id"].to_numpy(np.int64)
+        desconocidos = np.unique(cids[self.filas(cids) < 0])
+        n0 = self.n_filas
+        self._reservar(n0 + len(desconocidos), cids.max())
+
+        # Filas nuevas al final, con acumulados neutros
+        nuevas_filas = np.arange(n0, n0 + len(desconocidos))
+        self.indice[desconocidos] = nuevas_filas
+        self.ids[nuevas_filas] = desconocidos
+        self.datos[nuevas_filas] = 0.0
+        self.datos[nuevas_filas, COL["gasto_maximo"]] = -np.inf
+        self.datos[nuevas_filas, COL["primera_compra"]] = np.inf
+        self.datos[nuevas_filas, COL["ultima_compra"]] = -np.inf
+        self.meta["n_filas"] = n0 + len(desconocidos)
+
+        # Agregados del lote por fila tocada
+        tocadas, inv = np.unique(self.indice[cids], return_inverse=True)
+        k = len(tocadas)
+        precio = nuevas["precio"].to_numpy(float)
+        segundos = nuevas["fecha_venta"].to_numpy("datetime64[s]").astype(np.int64).astype(float)
+
+        maximo  = np.full(k, -np.inf)
+        primera = np.full(k, np.inf)
+        ultima  = np.full(k, -np.inf)
+        np.maximum.at(maximo, inv, precio)
+        np.minimum.at(primera, inv, segundos)
+        np.maximum.at(ultima, inv, segundos)
+
+        d, c = self.datos, COL
+        d[tocadas, c["total_gastado"]] += np.bincount(inv, weights=precio, minlength=k)
+        d[tocadas, c["num_compras"]]   += np.bincount(inv, minlength=k)
+        columna_producto = pd.Index(self.meta["productos"]).get_indexer(nuevas["producto"])
+        np.add.at(self.conteos, (tocadas[inv], columna_producto), 1)
+        d[tocadas, c["gasto_maximo"]]   = np.maximum(d[tocadas, c["gasto_maximo"]], maximo)
+        d[tocadas, c["primera_compra"]] = np.minimum(d[tocadas, c["primera_compra"]], primera)
+
+        # Gasto móvil 48h de la venta más reciente de cada cliente
+        if "gasto_promedio_48h" in nuevas:
+            orden = np.argsort(segundos, kind="stable")
+            gasto_48h = np.empty(k)
+            gasto_48h[inv[orden]] = nuevas["gasto_promedio_48h"].to_numpy(float)[orden]
+            mas_reciente = ultima >= d[tocadas, c["ultima_compra"]]
+            d[tocadas[mas_reciente], c["gasto_promedio_48h"]] = gasto_48h[mas_reciente]
+        d[tocadas, c["ultima_compra"]] = np.maximum(d[tocadas, c["ultima_compra"]], ultima)
+
+        self._recalcular(tocadas)
+        if recodificado:
+            self._recalcular_favorito(np.arange(self.n_filas))
+        self._registrar_ventas(nuevas)
+        self.datos.flush()
+        self.conteos.flush()
+        self.ids.flush()
+        self.indice.flush()
+        self._guardar_meta()
+        return len(nuevas)
+
+    def _recalcular(self, filas):
+        """Variables derivadas de los acumulados, con la misma definición
+        que el perfil original de modelo_sklearn.py."""
+        d, c = self.datos, COL
+        n       = d[filas, c["num_compras"]]
+        primera = d[filas, c["primera_compra"]]
+        ultima  = d[filas, c["ultima_compra"]]
+        referencia = np.datetime64(self.meta["fecha_referencia"], "s").astype(np.int64)
+
+        d[filas, c["gasto_promedio"]]     = d[filas, c["total_gastado"]] / n
+        d[filas, c["mes_ultima_compra"]]  = (
+            ultima.astype(np.int64).astype("datetime64[s]").astype("datetime64[M]").astype(np.int64) % 12 + 1
+        )
+        d[filas, c["dias_entre_compras"]] = (
+            np.floor((ultima - primera) / SEGUNDOS_DIA) / np.maximum(n - 1, 1)
+        )
+        d[filas, c["dias_desde_ultima"]]  = np.floor((referencia - ultima) / SEGUNDOS_DIA)
+        self._recalcular_favorito(filas)
+
+    def _recalcular_favorito(self, filas):
+        """Media del encoding vigente de los productos comprados."""
+        codificacion = np.array(self.meta["codificacion"])
+        self.datos[filas, COL["producto_favorito"]] = (
+            self.conteos[filas] @ codificacion / self.datos[filas, COL["num_compras"]]
+        )
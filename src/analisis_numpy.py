@@ -4,27 +4,55 @@
 import numpy as np
 import pandas as pd
 import os
+from muestreo import MODO_MUESTREO, dir_procesados, Muestra, total, media, cuantil, resumen
 
-os.makedirs("data/processed", exist_ok=True)
+carpeta = dir_procesados()
+os.makedirs(carpeta, exist_ok=True)
 
 # ── CARGAR DATOS ───────────────────────────────────
 print(" Cargando datos procesados...")
-df = pd.read_csv("data/processed/ventas_procesadas.csv")
+df = pd.read_csv(f"{carpeta}/ventas_procesadas.csv")
 precios = df["precio"].values
 
+if MODO_MUESTREO != "exacto":
+    muestra = Muestra.cargar(df, carpeta)
+    pesos = df["_peso"].values
+    print(f"   Modo {MODO_MUESTREO}: {len(df):,} ventas en la muestra "
+          f"(estimaciones con IC 95%)")
+else:
+    pesos = np.ones(len(df))
+
+def con_ic(valor, inf, sup):
+    return f"S/. {valor:,.2f}  [IC 95%: {inf:,.2f} — {sup:,.2f}]"
+
 # ── 1. ESTADÍSTICAS AVANZADAS ──────────────────────
 print("\n Estadísticas de ventas:")
-print(f"   Promedio    : S/. {np.mean(precios):,.2f}")
-print(f"   Mediana     : S/. {np.median(precios):,.2f}")
-print(f"   Desv. Est.  : S/. {np.std(precios):,.2f}")
-print(f"   Mínimo      : S/. {np.min(precios):,.2f}")
-print(f"   Máximo      : S/. {np.max(precios):,.2f}")
-print(f"   Total       : S/. {np.sum(precios):,.2f}")
+if MODO_MUESTREO == "exacto":
+    print(f"   Promedio    : S/. {np.mean(precios):,.2f}")
+    print(f"   Mediana     : S/. {np.median(precios):,.2f}")
+    print(f"   Desv. Est.  : S/. {np.std(precios):,.2f}")
+    print(f"   Mínimo      : S/. {np.min(precios):,.2f}")
+    print(f"   Máximo      : S/. {np.max(precios):,.2f}")
+    print(f"   Total       : S/. {np.sum(precios):,.2f}")
+else:
+    promedio = media(muestra, "precio").iloc[0]
+    suma = total(muestra, "precio").iloc[0]
+    desv = np.sqrt(np.average((precios - promedio["media"]) ** 2, weights=pesos))
+    print(f"   Promedio    : {con_ic(*promedio.values)}")
+    print(f"   Mediana     : {con_ic(*cuantil(muestra, 'precio', 0.5))}")
+    print(f"   Desv. Est.  : S/. {desv:,.2f}")
+    print(f"   Mínimo      : S/. {np.min(precios):,.2f}  (en la muestra)")
+    print(f"   Máximo      : S/. {np.max(precios):,.2f}  (en la muestra)")
+    print(f"   Total       : {con_ic(*suma.values)}")
 
 # ── 2. DETECCIÓN DE PRECIOS ATÍPICOS ──────────────
 print("\n Detectando precios atípicos...")
-Q1 = np.percentile(precios, 25)
-Q3 = np.percentile(precios, 75)
+if MODO_MUESTREO == "exacto":
+    Q1 = np.percentile(precios, 25)
+    Q3 = np.percentile(precios, 75)
+else:
+    Q1 = cuantil(muestra, "precio", 0.25)[0]
+    Q3 = cuantil(muestra, "precio", 0.75)[0]
 IQR = Q3 - Q1
 
 limite_inferior = Q1 - 1.5 * IQR
@@ -34,6 +62,12 @@ outliers = df[(df["precio"] < limite_inferior) | (df["precio"] > limite_superior
 
 print(f"   Rango normal : S/. {limite_inferior:,.2f} — S/. {limite_superior:,.2f}")
 print(f"   Ventas atípicas encontradas: {len(outliers)}")
+if MODO_MUESTREO != "exacto":
+    es_atipica = (df["precio"] < limite_inferior) | (df["precio"] > limite_superior)
+    m_atipicas = Muestra(df.assign(_atipica=es_atipica.astype(float)), muestra.diseno)
+    est = total(m_atipicas, "_atipica").iloc[0]
+    print(f"   Estimadas en la población  : {est['total']:,.0f} "
+          f"[IC 95%: {max(est['total_ic_inf'], 0):,.0f} — {est['total_ic_sup']:,.0f}]")
 print(outliers[["venta_id", "producto", "marca", "precio"]].head())
 
 # ── 3. INGRESO PROMEDIO POR PRODUCTO ──────────────
@@ -41,12 +75,21 @@ print("\n Ingreso promedio por producto (vectorizado):")
 productos = df["producto"].values
 precios_arr = df["precio"].values
 
-productos_unicos = np.unique(productos)
-for prod in productos_unicos:
-    mask = productos == prod
-    promedio = np.mean(precios_arr[mask])
-    total = np.sum(precios_arr[mask])
-    print(f"   {prod:<20} Promedio: S/. {promedio:,.2f}  |  Total: S/. {total:,.2f}")
+if MODO_MUESTREO == "exacto":
+    productos_unicos = np.unique(productos)
+    for prod in productos_unicos:
+        mask = productos == prod
+        promedio = np.mean(precios_arr[mask])
+        total_prod = np.sum(precios_arr[mask])
+        print(f"   {prod:<20} Promedio: S/. {promedio:,.2f}  |  Total: S/. {total_prod:,.2f}")
+else:
+    por_producto = resumen(
+        muestra, "producto", promedio=("media", "precio"), total=("total", "precio")
+    )
+    for prod, fila in por_producto.iterrows():
+        print(f"   {prod:<20} Promedio: S/. {fila['promedio']:,.2f} "
+              f"(± {fila['promedio_ic_sup'] - fila['promedio']:,.2f})  |  "
+              f"Total: S/. {fila['total']:,.2f} (± {fila['total_ic_sup'] - fila['total']:,.2f})")
 
 # ── 4. TARGET ENCODING VECTORIZADO ────────────────
 print("\n Target Encoding de productos (vectorizado)...")
@@ -55,11 +98,12 @@ print("\n Target Encoding de productos (vectorizado)...")
 target = (precios_arr - np.min(precios_arr)) / (np.max(precios_arr) - np.min(precios_arr))
 
 cats_unicas, indices = np.unique(productos, return_inverse=True)
-suma_por_cat = np.bincount(indices, weights=target)
-count_por_cat = np.bincount(indices)
+# Con muestra, cada venta pesa lo que representa en la población
+suma_por_cat = np.bincount(indices, weights=target * pesos)
+count_por_cat = np.bincount(indices, weights=pesos)
 
 SMOOTH = 10
-media_global = np.mean(target)
+media_global = np.average(target, weights=pesos)
 encoding = (suma_por_cat + SMOOTH * media_global) / (count_por_cat + SMOOTH)
 
 df["producto_encoded"] = encoding[indices]
@@ -69,8 +113,8 @@ for i, prod in enumerate(cats_unicas):
     print(f"   {prod:<20} encoding: {encoding[i]:.4f}")
 
 # ── GUARDAR ────────────────────────────────────────
-df.to_csv("data/processed/ventas_con_encoding.csv", index=False)
-outliers.to_csv("data/processed/ventas_atipicas.csv", index=False)
+df.to_csv(f"{carpeta}/ventas_con_encoding.csv", index=False)
+outliers.to_csv(f"{carpeta}/ventas_atipicas.csv", index=False)
 
 print("\n Análisis NumPy completado")
-print(" Resultados guardados en data/processed/")
\ No newline at end of file
+print(f" Resultados guardados en {carpeta}/")
\ No newline at end of file
@@ -2,12 +2,13 @@
 # PEA 1 — Operaciones con Pandas
 import pandas as pd
 import numpy as np
+from muestreo import MODO_MUESTREO, FRACCION_MUESTRA, dir_procesados, muestrear, resumen
 
 # ── CARGAR DATOS ───────────────────────────────────
 print(" Cargando datos...")
-clientes = pd.read_csv("data/raw/clientes.csv", parse_dates=["fecha_registro"])
-ventas   = pd.read_csv("data/raw/ventas.csv",   parse_dates=["fecha_venta"])
-tickets  = pd.read_csv("data/raw/tickets.csv",  parse_dates=["fecha_ticket"])
+clientes = pd.read_csv("data/validated/clientes.csv", parse_dates=["fecha_registro"])
+ventas   = pd.read_csv("data/validated/ventas.csv",   parse_dates=["fecha_venta"])
+tickets  = pd.read_csv("data/validated/tickets.csv",  parse_dates=["fecha_ticket"])
 
 print(f"    Clientes : {len(clientes):,}")
 print(f"    Ventas   : {len(ventas):,}")
@@ -21,45 +22,81 @@ df_tickets = tickets.merge(clientes, on="cliente_id", how="left")
 print(f"   Tabla ventas+clientes  : {df_ventas.shape}")
 print(f"   Tabla tickets+clientes : {df_tickets.shape}")
 
+df_ventas["mes"] = df_ventas["fecha_venta"].dt.to_period("M")
+
+# ── MUESTREO (modo rápido) ─────────────────────────
+if MODO_MUESTREO != "exacto":
+    print(f"\n Modo {MODO_MUESTREO}: muestra del {FRACCION_MUESTRA:.0%} "
+          "(estimaciones con IC 95%)")
+    if MODO_MUESTREO == "clientes":
+        # Clientes completos: sus ventanas de 48h quedan intactas
+        muestra = muestrear(df_ventas, ["tipo_cliente"], unidad="cliente_id")
+    else:
+        muestra = muestrear(df_ventas, ["producto", "tipo_cliente", "mes"])
+    df_ventas = muestra.datos
+    print(f"   Ventas en la muestra   : {len(df_ventas):,}")
+
 # ── PREGUNTA 1: ¿Qué producto vende más? ──────────
 print("\n TOP productos más vendidos:")
-top_productos = (
-    df_ventas.groupby("producto")
-    .agg(
-        total_ventas=("venta_id", "count"),
-        ingreso_total=("precio", "sum"),
-        precio_promedio=("precio", "mean")
+if MODO_MUESTREO == "exacto":
+    top_productos = (
+        df_ventas.groupby("producto")
+        .agg(
+            total_ventas=("venta_id", "count"),
+            ingreso_total=("precio", "sum"),
+            precio_promedio=("precio", "mean")
+        )
+        .sort_values("ingreso_total", ascending=False)
+        .round(2)
     )
-    .sort_values("ingreso_total", ascending=False)
-    .round(2)
-)
+else:
+    top_productos = resumen(
+        muestra, "producto",
+        total_ventas=("conteo", None),
+        ingreso_total=("total", "precio"),
+        precio_promedio=("media", "precio")
+    ).sort_values("ingreso_total", ascending=False).round(2)
 print(top_productos)
 
 # ── PREGUNTA 2: ¿Qué tipo de cliente gasta más? ───
 print("\n👥 Gasto por tipo de cliente:")
-gasto_cliente = (
-    df_ventas.groupby("tipo_cliente")
-    .agg(
-        total_ventas=("venta_id", "count"),
-        ingreso_total=("precio", "sum"),
-        gasto_promedio=("precio", "mean")
+if MODO_MUESTREO == "exacto":
+    gasto_cliente = (
+        df_ventas.groupby("tipo_cliente")
+        .agg(
+            total_ventas=("venta_id", "count"),
+            ingreso_total=("precio", "sum"),
+            gasto_promedio=("precio", "mean")
+        )
+        .sort_values("ingreso_total", ascending=False)
+        .round(2)
     )
-    .sort_values("ingreso_total", ascending=False)
-    .round(2)
-)
+else:
+    gasto_cliente = resumen(
+        muestra, "tipo_cliente",
+        total_ventas=("conteo", None),
+        ingreso_total=("total", "precio"),
+        gasto_promedio=("media", "precio")
+    ).sort_values("ingreso_total", ascending=False).round(2)
 print(gasto_cliente)
 
 # ── PREGUNTA 3: Tendencia de ventas por mes ────────
 print("\n Tendencia de ventas mensual:")
-df_ventas["mes"] = df_ventas["fecha_venta"].dt.to_period("M")
-tendencia_mensual = (
-    df_ventas.groupby("mes")
-    .agg(
-        ventas=("venta_id", "count"),
-        ingresos=("precio", "sum")
+if MODO_MUESTREO == "exacto":
+    tendencia_mensual = (
+        df_ventas.groupby("mes")
+        .agg(
+            ventas=("venta_id", "count"),
+            ingresos=("precio", "sum")
+        )
+        .round(2)
     )
-    .round(2)
-)
+else:
+    tendencia_mensual = resumen(
+        muestra, "mes",
+        ventas=("conteo", None),
+        ingresos=("total", "precio")
+    ).round(2)
 print(tendencia_mensual.head(10))
 
 # ── PREGUNTA 4: Window Function — Gasto móvil 48h ─
@@ -96,11 +133,14 @@ print(tickets_resumen)
 
 # ── GUARDAR RESULTADOS ─────────────────────────────
 import os
-os.makedirs("data/processed", exist_ok=True)
+carpeta = dir_procesados()
+os.makedirs(carpeta, exist_ok=True)
 
-df_ventas.to_csv("data/processed/ventas_procesadas.csv", index=False)
-top_productos.to_csv("data/processed/top_productos.csv")
-gasto_cliente.to_csv("data/processed/gasto_por_cliente.csv")
+df_ventas.to_csv(f"{carpeta}/ventas_procesadas.csv", index=False)
+top_productos.to_csv(f"{carpeta}/top_productos.csv")
+gasto_cliente.to_csv(f"{carpeta}/gasto_por_cliente.csv")
+if MODO_MUESTREO != "exacto":
+    muestra.guardar(carpeta)
 
 print("\n Análisis Pandas completado")
-print(" Resultados guardados en data/processed/")
\ No newline at end of file
+print(f" Resultados guardados en {carpeta}/")
\ No newline at end of file
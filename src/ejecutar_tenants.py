@@ -0,0 +1,157 @@
+# src/ejecutar_tenants.py
+# Ejecución del pipeline para varios negocios en paralelo
+# Cada negocio (tenant) tiene su propia raíz con data/raw/; el pipeline
+# completo corre dentro de esa raíz en un pool acotado de procesos
+#
+# Uso:
+#   python src/ejecutar_tenants.py tiendas/tienda_a tiendas/tienda_b ...
+#   python src/ejecutar_tenants.py tiendas.txt     (una raíz por línea)
+
+import contextlib
+import multiprocessing as mp
+import os
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# ── CONFIGURACIÓN ──────────────────────────────────
+PROCESOS_TENANT  = int(os.environ.get("PROCESOS_TENANT", max((os.cpu_count() or 1) // 2, 1)))
+HILOS_POR_TENANT = int(os.environ.get("HILOS_POR_TENANT", 2))
+MEMORIA_MB       = int(os.environ.get("MEMORIA_MB_TENANT", 0))  # 0 = sin límite
+
+DIR_SRC = os.path.dirname(os.path.abspath(__file__))
+
+PIPELINE = [
+    "validar_datos.py",
+    "analisis_pandas.py",
+    "analisis_numpy.py",
+    "modelo_sklearn.py",
+    "modelo_pytorch.py",
+    "reporte_final.py",
+]
+
+# Se importan una vez en el proceso forkserver; cada tenant arranca de
+# una copia de ese proceso con las librerías ya cargadas
+IMPORTS_PRECARGADOS = [
+    "numpy", "pandas", "joblib", "threadpoolctl",
+    "sklearn.ensemble", "sklearn.preprocessing",
+    "sklearn.model_selection", "sklearn.metrics",
+    "torch", "matplotlib.pyplot",
+]
+
+
+def tamano_datos(raiz):
+    """Bytes de data/raw/ del tenant, para ordenar de menor a mayor."""
+    carpeta = os.path.join(raiz, "data", "raw")
+    if not os.path.isdir(carpeta):
+        return 0
+    return sum(
+        os.path.getsize(os.path.join(carpeta, f)) for f in os.listdir(carpeta)
+    )
+
+
+def _limitar_recursos(hilos, memoria_mb):
+    # Variables leídas por modelo_pytorch.py y por librerías que aún no
+    # hayan creado su pool de hilos
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(hilos)
+    os.environ["TORCH_HILOS_INTRA"] = str(hilos)
+    os.environ["TORCH_HILOS_INTER"] = "1"
+
+    # Librerías ya cargadas por el forkserver
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(hilos)
+
+    if memoria_mb > 0:
+        import resource  # solo POSIX; main() no deja llegar aquí en Windows
+        limite = memoria_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+
+
+def ejecutar_tenant(raiz, hilos, memoria_mb):
+    """Corre el pipeline completo dentro de la raíz del tenant.
+
+    Toda la salida va a data/outputs/pipeline.log del tenant. Devuelve
+    (raiz, estado, segundos, detalle).
+    """
+    inicio = time.perf_counter()
+    _limitar_recursos(hilos, memoria_mb)
+    os.chdir(raiz)
+    if DIR_SRC not in sys.path:
+        sys.path.insert(0, DIR_SRC)
+
+    os.makedirs("data/outputs", exist_ok=True)
+    with open("data/outputs/pipeline.log", "w", encoding="utf-8") as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        for script in PIPELINE:
+            try:
+                runpy.run_path(os.path.join(DIR_SRC, script), run_name="__main__")
+            except BaseException as e:  # SystemExit incluido: corta solo este tenant
+                traceback.print_exc()
+                return raiz, "error", time.perf_counter() - inicio, f"{script}: {e!r}"
+    return raiz, "ok", time.perf_counter() - inicio, ""
+
+
+def leer_raices(argumentos):
+    raices = []
+    for arg in argumentos:
+        if os.path.isfile(arg):
+            with open(arg, encoding="utf-8") as f:
+                raices += [linea.strip() for linea in f if linea.strip()]
+        else:
+            raices.append(arg)
+    return [os.path.abspath(r) for r in raices]
+
+
+if __name__ == "__main__":
+    raices = leer_raices(sys.argv[1:])
+    if not raices:
+        raise SystemExit(" Uso: python src/ejecutar_tenants.py RAIZ [RAIZ ...]")
+
+    if MEMORIA_MB > 0 and os.name != "posix":
+        print(" AVISO: MEMORIA_MB_TENANT no está soportado en este sistema "
+              "(requiere POSIX); los tenants corren sin límite de memoria")
+        MEMORIA_MB = 0
+
+    # forkserver solo existe en POSIX; en Windows se usa spawn (cada tenant
+    # importa las librerías por su cuenta)
+    if "forkserver" in mp.get_all_start_methods():
+        contexto = mp.get_context("forkserver")
+        contexto.set_forkserver_preload(IMPORTS_PRECARGADOS)
+    else:
+        contexto = mp.get_context("spawn")
+
+    # Los tenants pequeños van primero: no esperan detrás de uno grande
+    raices.sort(key=tamano_datos)
+
+    print("=" * 60)
+    print("  EJECUCIÓN MULTI-TENANT DEL PIPELINE")
+    print(f"  Tenants: {len(raices)} | Procesos: {PROCESOS_TENANT} | "
+          f"Hilos/tenant: {HILOS_POR_TENANT} | "
+          f"Memoria/tenant: {f'{MEMORIA_MB:,} MB' if MEMORIA_MB else 'sin límite'}")
+    print(f"  Arranque de procesos: {contexto.get_start_method()}")
+    print("=" * 60)
+
+    inicio = time.perf_counter()
+    errores = 0
+    # max_tasks_per_child=1: cada tenant en un proceso nuevo, sin estado
+    # ni límites heredados de otro tenant
+    with ProcessPoolExecutor(
+        max_workers=PROCESOS_TENANT,
+        mp_context=contexto,
+        max_tasks_per_child=1,
+    ) as pool:
+        futuros = [
+            pool.submit(ejecutar_tenant, raiz, HILOS_POR_TENANT, MEMORIA_MB)
+            for raiz in raices
+        ]
+        for futuro in as_completed(futuros):
+            raiz, estado, segundos, detalle = futuro.result()
+            errores += estado != "ok"
+            print(f"   [{estado:^5}] {segundos:7.1f} s  {raiz}  {detalle}")
+
+    print(f"\n Tenants completados: {len(raices) - errores}/{len(raices)} "
+          f"en {time.perf_counter() - inicio:.1f} s")
+    print(" Registro de cada tenant en <raiz>/data/outputs/pipeline.log")
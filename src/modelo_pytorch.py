@@ -9,66 +9,107 @@ import torch.nn as nn
 from torch.utils.data import DataLoader, TensorDataset
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.model_selection import train_test_split
+import io
 import os
+import time
 
 os.makedirs("data/outputs", exist_ok=True)
 
+# ── CONFIGURACIÓN DE INFERENCIA EN CPU ─────────────
+# Hilos de PyTorch (0 = valor por defecto de la máquina) y modo de
+# inferencia: "fp32" o "int8" (cuantización dinámica de LSTM y Linear).
+HILOS_INTRA     = int(os.environ.get("TORCH_HILOS_INTRA", 0))
+HILOS_INTER     = int(os.environ.get("TORCH_HILOS_INTER", 0))
+MODO_INFERENCIA = os.environ.get("MODO_INFERENCIA", "fp32")
+
+MODOS_INFERENCIA = {"fp32", "int8"}
+if MODO_INFERENCIA not in MODOS_INFERENCIA:
+    raise SystemExit(f" MODO_INFERENCIA inválido: {MODO_INFERENCIA!r} "
+                     f"(valores permitidos: {', '.join(sorted(MODOS_INFERENCIA))})")
+
+# torch.ao.quantization.quantize_dynamic está marcado como obsoleto y
+# PyTorch anuncia su retiro; si la versión instalada ya no lo trae, la
+# comparativa int8 se omite y MODO_INFERENCIA=int8 no está disponible
+quantize_dynamic = getattr(torch.ao.quantization, "quantize_dynamic", None)
+if MODO_INFERENCIA == "int8" and quantize_dynamic is None:
+    raise SystemExit(" MODO_INFERENCIA=int8 requiere torch.ao.quantization.quantize_dynamic, "
+                     "que no existe en esta versión de PyTorch")
+
+if HILOS_INTRA > 0:
+    torch.set_num_threads(HILOS_INTRA)
+if HILOS_INTER > 0:
+    torch.set_num_interop_threads(HILOS_INTER)
+
 print("=" * 60)
 print("  SISTEMA DE PREDICCIÓN — PyTorch")
 print(f"  Dispositivo: {'GPU' if torch.cuda.is_available() else 'CPU'}")
+print(f"  Hilos: {torch.get_num_threads()} intra / "
+      f"{torch.get_num_interop_threads()} inter | Inferencia: {MODO_INFERENCIA}")
 print("=" * 60)
 
 # ── CARGAR DATOS ───────────────────────────────────
 print("\n Cargando datos...")
 ventas   = pd.read_csv("data/processed/ventas_con_encoding.csv", parse_dates=["fecha_venta"])
-clientes = pd.read_csv("data/raw/clientes.csv")
+clientes = pd.read_csv("data/validated/clientes.csv")
 
 # ── PREPARAR SERIE TEMPORAL POR DÍA ───────────────
 print("\n Construyendo serie temporal diaria...")
 
-ventas["fecha"] = ventas["fecha_venta"].dt.date
-
 # Agregar tipo de cliente
 ventas["tipo_cliente"] = ventas["cliente_id"].map(
     clientes.set_index("cliente_id")["tipo_cliente"]
 )
 
-# Producto más vendido del día
-producto_del_dia = (
-    ventas.groupby(["fecha", "producto"])
-    .size()
-    .reset_index(name="cantidad")
-    .sort_values(["fecha", "cantidad"], ascending=[True, False])
-    .groupby("fecha")
-    .first()
-    .reset_index()[["fecha", "producto"]]
-)
-
-# Tipo de cliente más activo del día
-tipo_del_dia = (
-    ventas.groupby(["fecha", "tipo_cliente"])
-    .size()
-    .reset_index(name="cantidad")
-    .sort_values(["fecha", "cantidad"], ascending=[True, False])
-    .groupby("fecha")
-    .first()
-    .reset_index()[["fecha", "tipo_cliente"]]
-)
-
-# Serie principal
-serie = (
-    ventas.groupby("fecha")
-    .agg(
-        ingresos      = ("precio", "sum"),
-        num_ventas    = ("venta_id", "count"),
-        precio_prom   = ("precio", "mean")
-    )
-    .reset_index()
-)
-
-serie = serie.merge(producto_del_dia, on="fecha", how="left")
-serie = serie.merge(tipo_del_dia, on="fecha", how="left")
-serie = serie.sort_values("fecha").reset_index(drop=True)
+# Columnas categóricas de las que se saca la moda diaria y su participación
+COLUMNAS_MODA = ["producto", "tipo_cliente", "marca"]
+
+def agregados_diarios(ventas, columnas_cat):
+    """Serie diaria con totales, modas categóricas y calendario en una pasada.
+
+    Cada día es un entero desde la primera venta; los conteos por
+    (día, categoría) salen de un solo bincount 2-D y la moda es el argmax
+    de cada fila, sin ordenar ni unir tablas intermedias. Los empates se
+    resuelven por orden alfabético de la categoría.
+    """
+    dias_venta = ventas["fecha_venta"].dt.normalize()
+    inicio = dias_venta.min()
+    cod_dia = ((dias_venta - inicio) // pd.Timedelta(days=1)).to_numpy()
+    n_dias = cod_dia.max() + 1
+
+    num_ventas = np.bincount(cod_dia, minlength=n_dias)
+    ingresos = np.bincount(cod_dia, weights=ventas["precio"].to_numpy(), minlength=n_dias)
+    con_ventas = num_ventas > 0
+
+    fechas = inicio + pd.to_timedelta(np.flatnonzero(con_ventas), unit="D")
+    serie = pd.DataFrame({
+        "fecha"       : fechas.date,
+        "ingresos"    : ingresos[con_ventas],
+        "num_ventas"  : num_ventas[con_ventas],
+        "precio_prom" : ingresos[con_ventas] / num_ventas[con_ventas],
+    })
+
+    for col in columnas_cat:
+        cod_cat, categorias = pd.factorize(ventas[col], sort=True)
+        k = len(categorias)
+        validos = cod_cat >= 0  # los NaN no cuentan para la moda
+        conteos = np.bincount(
+            cod_dia[validos] * k + cod_cat[validos], minlength=n_dias * k
+        ).reshape(n_dias, k)[con_ventas]
+
+        total = conteos.sum(axis=1)
+        moda = np.asarray(categorias, dtype=object)[conteos.argmax(axis=1)]
+        moda[total == 0] = np.nan
+        serie[col] = moda
+        serie[f"{col}_share"] = conteos.max(axis=1) / np.maximum(total, 1)
+
+    # Variables de calendario
+    serie["dia_semana"]     = fechas.dayofweek
+    serie["dia_mes"]        = fechas.day
+    serie["mes"]            = fechas.month
+    serie["fin_de_semana"]  = (fechas.dayofweek >= 5).astype(int)
+    return serie
+
+serie = agregados_diarios(ventas, COLUMNAS_MODA)
 
 # Codificar categóricas
 le_producto = LabelEncoder()
@@ -84,32 +125,58 @@ print("\n Creando secuencias de entrenamiento...")
 
 VENTANA = 7  # Usar 7 días para predecir el día siguiente
 
-FEATURES_NUM = ["ingresos", "num_ventas", "precio_prom", "producto_cod", "tipo_cod"]
+HORIZONTES  = [7, 14, 28]      # Días a futuro del pronóstico multi-horizonte
+H_MAX       = max(HORIZONTES)
+MC_MUESTRAS = 200              # Muestras Monte-Carlo dropout para las bandas
+
+FEATURES_NUM = [
+    "ingresos", "num_ventas", "precio_prom", "producto_cod", "tipo_cod",
+    "producto_share", "tipo_cliente_share", "dia_semana"
+]
 
 scaler = StandardScaler()
 datos_scaled = scaler.fit_transform(serie[FEATURES_NUM])
 
 def crear_secuencias(datos, ventana):
-    X, y_ing, y_prod, y_tipo = [], [], [], []
+    X, y_ing, y_prod, y_tipo, y_hor = [], [], [], [], []
     for i in range(len(datos) - ventana):
         X.append(datos[i:i+ventana])
         y_ing.append(datos[i+ventana][0])   # ingresos
         y_prod.append(serie["producto_cod"].iloc[i+ventana])  # producto
         y_tipo.append(serie["tipo_cod"].iloc[i+ventana])      # tipo cliente
+        # Ingresos de los próximos H_MAX días (NaN donde la serie termina)
+        futuro = datos[i+ventana:i+ventana+H_MAX, 0]
+        y_hor.append(np.concatenate([futuro, np.full(H_MAX - len(futuro), np.nan)]))
     return (
         np.array(X),
         np.array(y_ing),
         np.array(y_prod),
-        np.array(y_tipo)
+        np.array(y_tipo),
+        np.array(y_hor)
     )
 
-X, y_ing, y_prod, y_tipo = crear_secuencias(datos_scaled, VENTANA)
+def purgar(y_hor, limite):
+    """Copia de `y_hor` con NaN en los días que son objetivo de la ventana
+    `limite` o posteriores.
+
+    El día k de la ventana i es el primer objetivo de la ventana i+k: sin
+    la purga, las últimas ventanas de un tramo aprenden (o se calibran con)
+    los mismos días que se evalúan en el tramo siguiente.
+    """
+    y_hor = np.array(y_hor, dtype=float)
+    fila = np.arange(len(y_hor))[:, None]
+    dia  = np.arange(y_hor.shape[1])[None, :]
+    y_hor[fila + dia >= limite] = np.nan
+    return y_hor
+
+X, y_ing, y_prod, y_tipo, y_hor = crear_secuencias(datos_scaled, VENTANA)
 
 # Convertir a tensores
 X_tensor      = torch.FloatTensor(X)
 y_ing_tensor  = torch.FloatTensor(y_ing).unsqueeze(1)
 y_prod_tensor = torch.LongTensor(y_prod)
 y_tipo_tensor = torch.LongTensor(y_tipo)
+y_hor_tensor  = torch.FloatTensor(y_hor)
 
 # Split
 split = int(len(X) * 0.8)
@@ -117,6 +184,9 @@ X_train, X_test         = X_tensor[:split], X_tensor[split:]
 yi_train, yi_test       = y_ing_tensor[:split], y_ing_tensor[split:]
 yp_train, yp_test       = y_prod_tensor[:split], y_prod_tensor[split:]
 yt_train, yt_test       = y_tipo_tensor[:split], y_tipo_tensor[split:]
+yh_train, yh_test       = y_hor_tensor[:split], y_hor_tensor[split:]
+# Purga: los objetivos de horizonte del entrenamiento no pisan días de prueba
+yh_train = torch.FloatTensor(purgar(yh_train, split))
 
 print(f"   Entrenamiento: {len(X_train)} secuencias")
 print(f"   Prueba       : {len(X_test)} secuencias")
@@ -128,7 +198,7 @@ NUM_PRODUCTOS = serie["producto_cod"].nunique()
 NUM_TIPOS     = serie["tipo_cod"].nunique()
 
 class RedPrediccion(nn.Module):
-    def __init__(self, input_size, hidden_size, num_productos, num_tipos):
+    def __init__(self, input_size, hidden_size, num_productos, num_tipos, horizonte=H_MAX):
         super(RedPrediccion, self).__init__()
 
         # Capa compartida LSTM
@@ -161,13 +231,24 @@ class RedPrediccion(nn.Module):
             nn.Linear(32, num_tipos)
         )
 
+        # Cabeza 4: ingresos diarios de los próximos `horizonte` días.
+        # Salida directa multi-horizonte; el Dropout permite muestrear
+        # bandas de incertidumbre con Monte-Carlo dropout.
+        self.cabeza_horizonte = nn.Sequential(
+            nn.Linear(hidden_size, 64),
+            nn.ReLU(),
+            nn.Dropout(0.2),
+            nn.Linear(64, horizonte)
+        )
+
     def forward(self, x):
         lstm_out, _ = self.lstm(x)
         ultimo = lstm_out[:, -1, :]  # último paso temporal
         return (
             self.cabeza_ingresos(ultimo),
             self.cabeza_producto(ultimo),
-            self.cabeza_tipo(ultimo)
+            self.cabeza_tipo(ultimo),
+            self.cabeza_horizonte(ultimo)
         )
 
 modelo = RedPrediccion(
@@ -194,14 +275,18 @@ for epoch in range(EPOCHS):
     modelo.train()
     optimizer.zero_grad()
 
-    pred_ing, pred_prod, pred_tipo = modelo(X_train)
+    pred_ing, pred_prod, pred_tipo, pred_hor = modelo(X_train)
 
     loss_ing  = criterio_reg(pred_ing, yi_train)
     loss_prod = criterio_clas(pred_prod, yp_train)
     loss_tipo = criterio_clas(pred_tipo, yt_train)
 
+    # MSE del horizonte solo sobre los días que existen en la serie
+    mask_hor = ~torch.isnan(yh_train)
+    loss_hor = ((pred_hor - yh_train.nan_to_num()) ** 2)[mask_hor].mean()
+
     # Loss total combinada
-    loss_total = loss_ing + loss_prod + loss_tipo
+    loss_total = loss_ing + loss_prod + loss_tipo + loss_hor
     loss_total.backward()
     optimizer.step()
 
@@ -216,7 +301,7 @@ print(" Entrenamiento completado")
 print("\n Evaluando modelo...")
 modelo.eval()
 with torch.no_grad():
-    pred_ing, pred_prod, pred_tipo = modelo(X_test)
+    pred_ing, pred_prod, pred_tipo, pred_hor = modelo(X_test)
 
     # Ingresos
     ing_reales    = yi_test.numpy().flatten()
@@ -232,18 +317,84 @@ with torch.no_grad():
     tipo_predichos = pred_tipo.argmax(dim=1).numpy()
     acc_tipo = (tipo_predichos == tipo_reales).mean() * 100
 
+    # Horizonte: error absoluto medio diario en S/. para cada horizonte
+    err_hor = (pred_hor - yh_test).abs().numpy() * scaler.scale_[0]
+    mae_hor = {h: np.nanmean(err_hor[:, :h]) for h in HORIZONTES}
+
+    # Residuos del horizonte en S/. (real - predicho) sobre la primera mitad
+    # de la prueba; la segunda mitad queda para medir la cobertura. La misma
+    # purga evita calibrar con días que se usan para medirla
+    mitad_test   = len(X_test) // 2
+    residuos_hor = purgar(
+        ((yh_test - pred_hor).numpy() * scaler.scale_[0])[:mitad_test], mitad_test
+    )
+
 print(f"   Accuracy producto más vendido : {acc_prod:.2f}%")
 print(f"   Accuracy tipo de cliente      : {acc_tipo:.2f}%")
+for h in HORIZONTES:
+    print(f"   MAE diario horizonte {h:>2} días  : S/. {mae_hor[h]:,.2f}")
+
+# ── COMPARATIVA FP32 vs INT8 ───────────────────────
+print("\n Cuantización dinámica int8 (LSTM + Linear)...")
+
+modelo_int8 = None
+if quantize_dynamic is not None:
+    modelo_int8 = quantize_dynamic(modelo, {nn.LSTM, nn.Linear}, dtype=torch.qint8)
+
+def tamano_mb(m):
+    buffer = io.BytesIO()
+    torch.save(m.state_dict(), buffer)
+    return buffer.tell() / 1e6
+
+def latencia_ms(m, x, repeticiones=20):
+    with torch.no_grad():
+        m(x)  # calentamiento
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            m(x)
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+def evaluar(m):
+    m.eval()
+    with torch.no_grad():
+        p_ing, p_prod, p_tipo, p_hor = m(X_test)
+    return {
+        "mae_ingresos"   : (p_ing - yi_test).abs().mean().item() * scaler.scale_[0],
+        "mae_horizonte"  : np.nanmean((p_hor - yh_test).abs().numpy()) * scaler.scale_[0],
+        "acc_producto_%" : (p_prod.argmax(dim=1) == yp_test).float().mean().item() * 100,
+        "acc_tipo_%"     : (p_tipo.argmax(dim=1) == yt_test).float().mean().item() * 100,
+        "ms_lote"        : latencia_ms(m, X_test),
+        "ms_serie"       : latencia_ms(m, X_test[:1]),
+        "tamano_mb"      : tamano_mb(m),
+    }
+
+modelos_comparados = {"fp32": modelo}
+if modelo_int8 is not None:
+    modelos_comparados["int8"] = modelo_int8
+else:
+    print("   quantize_dynamic no disponible en esta versión de PyTorch: solo fp32")
+comparativa = pd.DataFrame(
+    [evaluar(m) for m in modelos_comparados.values()], index=list(modelos_comparados)
+).round(4)
+comparativa.index.name = "modelo"
+print(comparativa.to_string())
+if modelo_int8 is not None:
+    print(f"   Aceleración int8 (lote): "
+          f"{comparativa.loc['fp32', 'ms_lote'] / comparativa.loc['int8', 'ms_lote']:.2f}x")
+
+modelo_inferencia = modelo_int8 if MODO_INFERENCIA == "int8" else modelo
 
 # ── PREDICCIÓN PRÓXIMA SEMANA ──────────────────────
 print("\n" + "═" * 60)
 print("  PREDICCIÓN — PRÓXIMA SEMANA")
 print("═" * 60)
 
-modelo.eval()
+# Últimos VENTANA días observados (incluye el día más reciente)
+ultima_secuencia = torch.FloatTensor(datos_scaled[-VENTANA:]).unsqueeze(0)
+
+modelo_inferencia.eval()
 with torch.no_grad():
-    ultima_secuencia = X_tensor[-1].unsqueeze(0)
-    pred_ing, pred_prod, pred_tipo = modelo(ultima_secuencia)
+    pred_ing, pred_prod, pred_tipo, _ = modelo_inferencia(ultima_secuencia)
 
     # Reconstruir ingreso real (des-escalar)
     dummy = np.zeros((1, len(FEATURES_NUM)))
@@ -258,13 +409,109 @@ with torch.no_grad():
         [pred_tipo.argmax().item()]
     )[0]
 
-print(f"\n   Ingresos estimados     : S/. {ingreso_predicho:,.2f}")
+# ── PRONÓSTICO MULTI-HORIZONTE CON BANDAS ─────────
+def pronosticar_horizonte(modelo, ventanas, muestras=MC_MUESTRAS, residuos=residuos_hor, semilla=42):
+    """Ingresos diarios de los próximos H_MAX días con MC dropout.
+
+    `ventanas` tiene forma (series, VENTANA, features). Series y muestras
+    se apilan en un solo lote, así todo se calcula en una pasada de la red.
+    El dropout solo mide la incertidumbre del modelo: a cada muestra se le
+    suma además una trayectoria completa de residuos de calibración (ruido
+    de los datos, con su correlación entre días). Los días sin residuo al
+    final de una trayectoria se toman de otra del mismo día.
+    Devuelve un array (muestras, series, H_MAX) en S/.
+    """
+    n_series = ventanas.shape[0]
+    lote = ventanas.repeat(muestras, 1, 1)
+    modelo.train()  # dropout activo para el muestreo Monte-Carlo
+    with torch.no_grad():
+        _, _, _, pred = modelo(lote)
+    modelo.eval()
+    pred = pred.view(muestras, n_series, -1).numpy()
+    pred = pred * scaler.scale_[0] + scaler.mean_[0]
+
+    rng = np.random.default_rng(semilla)
+    ruido = residuos[rng.integers(len(residuos), size=(muestras, n_series))]
+    for dia in range(ruido.shape[2]):
+        hueco = np.isnan(ruido[:, :, dia])
+        if hueco.any():
+            validos = residuos[~np.isnan(residuos[:, dia]), dia]
+            ruido[:, :, dia][hueco] = rng.choice(validos, hueco.sum()) if len(validos) else 0.0
+    return pred + ruido
+
+# ── COBERTURA DE LAS BANDAS EN PRUEBA ─────────────
+# Fracción de valores reales dentro de P10–P90 (nominal 80%) en la
+# segunda mitad de la prueba, que no se usó para los residuos
+muestras_eval = pronosticar_horizonte(modelo_inferencia, X_test[mitad_test:])
+reales_eval   = yh_test[mitad_test:].numpy() * scaler.scale_[0] + scaler.mean_[0]
+b10, b90 = np.percentile(muestras_eval, [10, 90], axis=0)
+dentro = (reales_eval >= b10) & (reales_eval <= b90)
+
+acum_eval = np.percentile(muestras_eval.cumsum(axis=2), [10, 90], axis=0)
+acum_real = reales_eval.cumsum(axis=1)  # NaN si falta algún día
+cobertura = {}
+for h in HORIZONTES:
+    validos = ~np.isnan(reales_eval[:, :h])
+    completos = ~np.isnan(acum_real[:, h - 1])
+    total_dentro = (
+        (acum_real[completos, h - 1] >= acum_eval[0, completos, h - 1]) &
+        (acum_real[completos, h - 1] <= acum_eval[1, completos, h - 1])
+    )
+    cobertura[h] = (
+        dentro[:, :h][validos].mean() * 100,
+        total_dentro.mean() * 100 if completos.any() else np.nan,
+    )
+
+inicio = time.perf_counter()
+muestras_ing = pronosticar_horizonte(modelo_inferencia, ultima_secuencia)[:, 0, :]
+ms_por_serie = (time.perf_counter() - inicio) * 1000 / len(ultima_secuencia)
+
+p10, p50, p90 = np.percentile(muestras_ing, [10, 50, 90], axis=0)
+fechas_futuras = pd.to_datetime(serie["fecha"].iloc[-1]) + pd.to_timedelta(
+    np.arange(1, H_MAX + 1), unit="D"
+)
+pronostico_diario = pd.DataFrame({
+    "fecha"       : fechas_futuras.date,
+    "dia"         : np.arange(1, H_MAX + 1),
+    "ingreso_p10" : p10,
+    "ingreso_p50" : p50,
+    "ingreso_p90" : p90,
+}).round(2)
+
+# Totales por horizonte: se suma cada muestra antes de tomar cuantiles
+acumulado = muestras_ing.cumsum(axis=1)
+pronostico_horizontes = pd.DataFrame([
+    {
+        "horizonte_dias": h,
+        "ingreso_p10"   : np.percentile(acumulado[:, h - 1], 10),
+        "ingreso_p50"   : np.percentile(acumulado[:, h - 1], 50),
+        "ingreso_p90"   : np.percentile(acumulado[:, h - 1], 90),
+        "cobertura_diaria_%": cobertura[h][0],
+        "cobertura_total_%" : cobertura[h][1],
+    }
+    for h in HORIZONTES
+]).round(2)
+semana = pronostico_horizontes.set_index("horizonte_dias").loc[7]
+
+print(f"\n   Ingresos día siguiente : S/. {ingreso_predicho:,.2f}")
+print(f"   Ingresos próx. 7 días  : S/. {semana['ingreso_p50']:,.2f}"
+      f"  (P10 {semana['ingreso_p10']:,.0f} — P90 {semana['ingreso_p90']:,.0f})")
 print(f"   Producto más vendido   : {producto_predicho}")
 print(f"   Tipo de cliente activo : {tipo_predicho}")
 
+print("\n   Pronóstico por horizonte:")
+print(pronostico_horizontes.to_string(index=False))
+print(f"   Cobertura P10–P90 en prueba (nominal 80%), "
+      f"{len(X_test) - mitad_test} ventanas no usadas en la calibración")
+print(f"   Tiempo de inferencia   : {ms_por_serie:.2f} ms por serie "
+      f"({MC_MUESTRAS} muestras MC)")
+
 # ── GUARDAR ────────────────────────────────────────
 prediccion = pd.DataFrame([{
-    "ingreso_estimado"    : round(ingreso_predicho, 2),
+    "ingreso_estimado"    : semana["ingreso_p50"],
+    "ingreso_p10"         : semana["ingreso_p10"],
+    "ingreso_p90"         : semana["ingreso_p90"],
+    "ingreso_dia_siguiente": round(ingreso_predicho, 2),
     "producto_mas_vendido": producto_predicho,
     "tipo_cliente_activo" : tipo_predicho,
     "accuracy_producto_%" : round(acc_prod, 2),
@@ -272,8 +519,14 @@ prediccion = pd.DataFrame([{
 }])
 
 prediccion.to_csv("data/outputs/prediccion_proxima_semana.csv", index=False)
+pronostico_diario.to_csv("data/outputs/prediccion_diaria.csv", index=False)
+pronostico_horizontes.to_csv("data/outputs/prediccion_horizontes.csv", index=False)
+comparativa.to_csv("data/outputs/comparativa_cuantizacion.csv")
 
 print("\n" + "=" * 60)
 print("   MODELO PYTORCH COMPLETADO")
 print("   data/outputs/prediccion_proxima_semana.csv")
+print("   data/outputs/prediccion_diaria.csv")
+print("   data/outputs/prediccion_horizontes.csv")
+print("   data/outputs/comparativa_cuantizacion.csv")
 print("=" * 60)
\ No newline at end of file
@@ -7,11 +7,26 @@ import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.metrics import classification_report, accuracy_score
+from almacen_features import AlmacenFeatures, FEATURES, HistorialModificado
+import joblib
+import json
 import os
 
 os.makedirs("data/outputs", exist_ok=True)
+os.makedirs("data/models", exist_ok=True)
+
+# Configuración ganadora de ajustar_modelos.py; sin ella, la de siempre
+RUTA_HIPERPARAMETROS = "data/models/hiperparametros.json"
+hiperparametros = {}
+if os.path.exists(RUTA_HIPERPARAMETROS):
+    with open(RUTA_HIPERPARAMETROS, encoding="utf-8") as f:
+        hiperparametros = json.load(f)
+
+def parametros_modelo(nombre):
+    return hiperparametros.get(nombre, {}).get("parametros", {"n_estimators": 100})
 
 print("=" * 60)
 print("  SISTEMA INTELIGENTE DE ANÁLISIS COMERCIAL")
@@ -21,7 +36,7 @@ print("=" * 60)
 # ── CARGAR DATOS ───────────────────────────────────
 print("\n Cargando datos...")
 ventas   = pd.read_csv("data/processed/ventas_con_encoding.csv", parse_dates=["fecha_venta"])
-clientes = pd.read_csv("data/raw/clientes.csv", parse_dates=["fecha_registro"])
+clientes = pd.read_csv("data/validated/clientes.csv", parse_dates=["fecha_registro"])
 
 # ══════════════════════════════════════════════════
 # MÓDULO 1 — PRODUCTOS MÁS RENTABLES
@@ -58,20 +73,29 @@ print("\n" + "═" * 60)
 print("  MÓDULO 2: Perfil de clientes")
 print("═" * 60)
 
-perfil = ventas.groupby("cliente_id").agg(
-    total_gastado       = ("precio", "sum"),
-    gasto_promedio      = ("precio", "mean"),
-    gasto_maximo        = ("precio", "max"),
-    num_compras         = ("venta_id", "count"),
-    producto_favorito   = ("producto_encoded", "mean"),
-    mes_ultima_compra   = ("fecha_venta", lambda x: x.max().month),
-    dias_entre_compras  = ("fecha_venta", lambda x: (
-        (x.max() - x.min()).days / max(len(x) - 1, 1)
-    )),
-    dias_desde_ultima   = ("fecha_venta", lambda x: (
-        pd.Timestamp("2024-12-31") - x.max()
-    ).days)
-).reset_index()
+# El perfil vive en el almacén de features (data/features/): solo se
+# incorporan las ventas que aún no tiene. Si el historial fue reescrito
+# (ventas cambiadas o eliminadas) se rehace desde cero, igual que con
+# RECONSTRUIR_FEATURES=1
+almacen = AlmacenFeatures.abrir_o_crear(
+    reconstruir=os.environ.get("RECONSTRUIR_FEATURES", "0") == "1"
+)
+try:
+    nuevas = almacen.actualizar(ventas, completo=True)
+except HistorialModificado as e:
+    print(f"\n  AVISO: el historial de ventas cambió ({e}).")
+    print("  El almacén de features se reconstruye desde cero.")
+    almacen = AlmacenFeatures.crear()
+    nuevas = almacen.actualizar(ventas, completo=True)
+print(f" Ventas nuevas incorporadas al almacén: {nuevas:,}")
+
+perfil = pd.DataFrame(almacen.features(), columns=FEATURES)
+perfil.insert(0, "cliente_id", almacen.clientes())
+perfil = (
+    perfil.drop(columns="tipo_cliente_cod")
+    .sort_values("cliente_id")
+    .reset_index(drop=True)
+)
 
 # Agregar tipo de cliente
 perfil = perfil.merge(
@@ -81,9 +105,81 @@ perfil = perfil.merge(
 
 le = LabelEncoder()
 perfil["tipo_cliente_cod"] = le.fit_transform(perfil["tipo_cliente"].fillna("particular"))
+almacen.asignar("tipo_cliente_cod", perfil["cliente_id"], perfil["tipo_cliente_cod"])
 
 print(f" Perfil construido para {len(perfil):,} clientes")
 
+# ══════════════════════════════════════════════════
+# MÓDULO 2B — SEGMENTACIÓN DE CLIENTES
+# ══════════════════════════════════════════════════
+print("\n" + "═" * 60)
+print("  MÓDULO 2B: Segmentos de comportamiento")
+print("═" * 60)
+
+# Gasto, frecuencia, recencia y mezcla de productos (valor medio codificado)
+FEATURES_SEGMENTO = [
+    "total_gastado", "gasto_promedio", "num_compras",
+    "dias_entre_compras", "dias_desde_ultima", "producto_favorito"
+]
+N_SEGMENTOS     = 4
+LOTE_SEGMENTO   = 10_000
+EPOCAS_SEGMENTO = 5
+RUTA_SEGMENTOS  = "data/models/segmentacion.joblib"
+
+columnas_seg = [FEATURES.index(c) for c in FEATURES_SEGMENTO]
+
+def lotes_segmento():
+    """Recorre el almacén por bloques en float32, sin cargarlo entero."""
+    for inicio in range(0, almacen.n_filas, LOTE_SEGMENTO):
+        bloque = almacen.features(inicio, inicio + LOTE_SEGMENTO)[:, columnas_seg]
+        yield np.nan_to_num(bloque.astype(np.float32))
+
+# El modelo guardado se reutiliza: los clientes nuevos solo se asignan.
+# REENTRENAR_SEGMENTOS=1 vuelve a ajustar los centros
+if os.path.exists(RUTA_SEGMENTOS) and os.environ.get("REENTRENAR_SEGMENTOS", "0") != "1":
+    segmentacion = joblib.load(RUTA_SEGMENTOS)
+    print(" Modelo de segmentos existente: asignando clientes")
+else:
+    escalador_seg = StandardScaler()
+    for bloque in lotes_segmento():
+        escalador_seg.partial_fit(bloque)
+
+    kmeans = MiniBatchKMeans(n_clusters=N_SEGMENTOS, random_state=42, n_init=3)
+    for _ in range(EPOCAS_SEGMENTO):
+        for bloque in lotes_segmento():
+            kmeans.partial_fit(escalador_seg.transform(bloque))
+
+    segmentacion = {
+        "features" : FEATURES_SEGMENTO,
+        "escalador": escalador_seg,
+        "kmeans"   : kmeans,
+    }
+    joblib.dump(segmentacion, RUTA_SEGMENTOS)
+    print(f" {N_SEGMENTOS} segmentos ajustados con mini-batch k-means")
+
+segmento_por_fila = np.concatenate([
+    segmentacion["kmeans"].predict(segmentacion["escalador"].transform(bloque))
+    for bloque in lotes_segmento()
+])
+perfil["segmento"] = (
+    pd.Series(segmento_por_fila, index=almacen.clientes())
+    .reindex(perfil["cliente_id"])
+    .values
+)
+
+resumen_segmentos = (
+    perfil.groupby("segmento")
+    .agg(
+        clientes          = ("cliente_id", "count"),
+        gasto_total_medio = ("total_gastado", "mean"),
+        ticket_medio      = ("gasto_promedio", "mean"),
+        compras_medias    = ("num_compras", "mean"),
+        dias_sin_comprar  = ("dias_desde_ultima", "mean"),
+    )
+    .round(2)
+)
+print(resumen_segmentos.to_string())
+
 # ══════════════════════════════════════════════════
 # MÓDULO 3 — PREDECIR QUIÉN VOLVERÁ A COMPRAR
 # ══════════════════════════════════════════════════
@@ -93,13 +189,10 @@ print("═" * 60)
 
 perfil["volvio_a_comprar"] = (perfil["num_compras"] > 1).astype(int)
 
-FEATURES = [
-    "total_gastado", "gasto_promedio", "gasto_maximo",
-    "num_compras", "producto_favorito", "mes_ultima_compra",
-    "dias_entre_compras", "dias_desde_ultima", "tipo_cliente_cod"
-]
+# El segmento entra como una variable más de los modelos
+FEATURES_MODELO = FEATURES + ["segmento"]
 
-X = perfil[FEATURES].fillna(0)
+X = perfil[FEATURES_MODELO].fillna(0)
 y = perfil["volvio_a_comprar"]
 
 X_train, X_test, y_train, y_test = train_test_split(
@@ -110,7 +203,8 @@ scaler = StandardScaler()
 X_train_sc = scaler.fit_transform(X_train)
 X_test_sc  = scaler.transform(X_test)
 
-modelo_recurrente = RandomForestClassifier(n_estimators=100, random_state=42)
+modelo_recurrente = RandomForestClassifier(**parametros_modelo("recurrente"), random_state=42)
+print(f" Random Forest: {parametros_modelo('recurrente')}")
 modelo_recurrente.fit(X_train_sc, y_train)
 
 y_pred = modelo_recurrente.predict(X_test_sc)
@@ -145,15 +239,17 @@ perfil["en_riesgo"] = (
     (perfil["num_compras"] >= 2)
 ).astype(int)
 
-modelo_riesgo = GradientBoostingClassifier(n_estimators=100, random_state=42)
-X2 = perfil[FEATURES].fillna(0)
+modelo_riesgo = GradientBoostingClassifier(**parametros_modelo("riesgo"), random_state=42)
+print(f" Gradient Boosting: {parametros_modelo('riesgo')}")
+X2 = perfil[FEATURES_MODELO].fillna(0)
 y2 = perfil["en_riesgo"]
 
 X2_train, X2_test, y2_train, y2_test = train_test_split(
     X2, y2, test_size=0.2, random_state=42
 )
-X2_train_sc = scaler.fit_transform(X2_train)
-X2_test_sc  = scaler.transform(X2_test)
+scaler_riesgo = StandardScaler()
+X2_train_sc = scaler_riesgo.fit_transform(X2_train)
+X2_test_sc  = scaler_riesgo.transform(X2_test)
 
 modelo_riesgo.fit(X2_train_sc, y2_train)
 prob_riesgo = modelo_riesgo.predict_proba(X2_test_sc)[:, 1]
@@ -166,11 +262,10 @@ clientes_riesgo = (
     .sort_values("prob_no_volver", ascending=False)
     [["cliente_id", "ciudad", "tipo_cliente", "total_gastado",
       "dias_desde_ultima", "prob_no_volver"]]
-    .head(10)
     .round(2)
 )
 print(f"\n  Clientes en riesgo detectados: {len(clientes_riesgo)}")
-print(clientes_riesgo.to_string(index=False))
+print(clientes_riesgo.head(10).to_string(index=False))
 
 # ══════════════════════════════════════════════════
 # MÓDULO 5 — RECOMENDAR PRODUCTO A CADA CLIENTE
@@ -199,6 +294,24 @@ recomendaciones = (
 print("\n Producto recomendado por tipo de cliente:")
 print(recomendaciones.to_string(index=False))
 
+# Recomendación por segmento de comportamiento
+ventas_tipo["segmento"] = ventas_tipo["cliente_id"].map(
+    perfil.set_index("cliente_id")["segmento"]
+)
+recomendaciones_segmento = (
+    ventas_tipo.groupby(["segmento", "producto"])
+    .agg(veces_comprado=("venta_id", "count"))
+    .reset_index()
+    .sort_values(["segmento", "veces_comprado"], ascending=[True, False])
+    .groupby("segmento")
+    .first()
+    .reset_index()
+    [["segmento", "producto", "veces_comprado"]]
+)
+
+print("\n Producto recomendado por segmento:")
+print(recomendaciones_segmento.to_string(index=False))
+
 # ── GUARDAR TODOS LOS RESULTADOS ───────────────────
 perfil_test.sort_values("prob_volver_a_comprar", ascending=False).to_csv(
     "data/outputs/clientes_recurrentes.csv", index=False
@@ -209,6 +322,29 @@ clientes_riesgo.to_csv(
 recomendaciones.to_csv(
     "data/outputs/recomendaciones_producto.csv", index=False
 )
+recomendaciones_segmento.to_csv(
+    "data/outputs/recomendaciones_segmento.csv", index=False
+)
+resumen_segmentos.to_csv("data/outputs/segmentos_clientes.csv")
+
+# Modelos para la puntuación por lotes (puntuar_clientes.py)
+joblib.dump({
+    "features"          : FEATURES_MODELO,
+    "segmentacion"      : segmentacion,
+    "scaler_recurrente" : scaler,
+    "modelo_recurrente" : modelo_recurrente,
+    "scaler_riesgo"     : scaler_riesgo,
+    "modelo_riesgo"     : modelo_riesgo,
+}, "data/models/modelos_clientes.joblib")
+
+# Matrices de entrenamiento ya escaladas para ajustar_modelos.py: el
+# ajuste no vuelve a construir el perfil ni a escalar
+joblib.dump({
+    "X_recurrente": X_train_sc,
+    "y_recurrente": y_train.to_numpy(),
+    "X_riesgo"    : X2_train_sc,
+    "y_riesgo"    : y2_train.to_numpy(),
+}, "data/models/matriz_ajuste.joblib")
 
 print("\n" + "=" * 60)
 print("   SISTEMA COMERCIAL COMPLETADO")
@@ -217,4 +353,7 @@ print("     - productos_rentables.csv")
 print("     - clientes_recurrentes.csv")
 print("     - clientes_en_riesgo.csv")
 print("     - recomendaciones_producto.csv")
+print("     - recomendaciones_segmento.csv")
+print("     - segmentos_clientes.csv")
+print("   Modelos en data/models/modelos_clientes.joblib")
 print("=" * 60)
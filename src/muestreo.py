@@ -0,0 +1,173 @@
+# src/muestreo.py
+# Muestreo para iteración rápida en los análisis
+# Toma una muestra estratificada (o de clientes completos), calcula pesos
+# de expansión y estima totales, medias y cuantiles de la población con
+# intervalos de confianza analíticos
+
+import os
+import numpy as np
+import pandas as pd
+
+# MODO_MUESTREO: "exacto"        → datos completos, sin muestreo
+#                "estratificado" → ventas por producto, tipo de cliente y mes
+#                "clientes"      → clientes completos (conserva sus ventanas)
+MODO_MUESTREO    = os.environ.get("MODO_MUESTREO", "exacto")
+FRACCION_MUESTRA = float(os.environ.get("FRACCION_MUESTRA", 0.1))
+SEMILLA_MUESTRA  = int(os.environ.get("SEMILLA_MUESTRA", 42))
+
+Z_95 = 1.959964
+
+
+def dir_procesados():
+    """Carpeta de resultados intermedios: la muestra no pisa los exactos."""
+    if MODO_MUESTREO == "exacto":
+        return "data/processed"
+    return "data/processed/muestra"
+
+
+class Muestra:
+    """Filas muestreadas con su estrato, unidad y peso, más el diseño
+    (unidades por estrato en la población y en la muestra)."""
+
+    def __init__(self, datos, diseno):
+        self.datos = datos
+        self.diseno = diseno  # índice _estrato, columnas N y n
+
+    def guardar(self, carpeta):
+        self.diseno.to_csv(f"{carpeta}/diseno_muestra.csv")
+
+    @classmethod
+    def cargar(cls, datos, carpeta):
+        diseno = pd.read_csv(f"{carpeta}/diseno_muestra.csv", index_col="_estrato")
+        return cls(datos, diseno)
+
+
+def muestrear(df, estratos, unidad=None, fraccion=FRACCION_MUESTRA, semilla=SEMILLA_MUESTRA):
+    """Muestreo aleatorio simple sin reemplazo dentro de cada estrato.
+
+    Con `unidad=None` se muestrean filas; con una columna (p. ej.
+    "cliente_id") se muestrean unidades completas con todas sus filas,
+    y los estratos deben ser constantes dentro de cada unidad.
+    Cada estrato aporta al menos 2 unidades para poder estimar varianza.
+    """
+    rng = np.random.default_rng(semilla)
+    if unidad is None:
+        unidades = df[estratos].reset_index(drop=True)
+        unidades["_unidad"] = np.arange(len(df))
+    else:
+        unidades = df.drop_duplicates(unidad)[[unidad] + estratos].reset_index(drop=True)
+        unidades = unidades.rename(columns={unidad: "_unidad"})
+    unidades["_estrato"] = unidades.groupby(estratos, dropna=False).ngroup()
+
+    N = unidades.groupby("_estrato").size()
+    n = np.maximum(np.ceil(N * fraccion), np.minimum(N, 2)).astype(int)
+
+    orden = pd.Series(rng.random(len(unidades))).groupby(unidades["_estrato"]).rank(method="first")
+    elegidas = unidades[orden.values <= n.reindex(unidades["_estrato"]).values]
+
+    if unidad is None:
+        datos = df.iloc[elegidas["_unidad"].values].copy()
+        datos["_unidad"] = elegidas["_unidad"].values
+        datos["_estrato"] = elegidas["_estrato"].values
+    else:
+        datos = df[df[unidad].isin(elegidas["_unidad"])].copy()
+        datos["_unidad"] = datos[unidad].values
+        datos["_estrato"] = datos[unidad].map(elegidas.set_index("_unidad")["_estrato"]).values
+
+    diseno = pd.DataFrame({"N": N, "n": n})
+    diseno.index.name = "_estrato"
+    datos["_peso"] = (N / n).reindex(datos["_estrato"]).values
+    return Muestra(datos, diseno)
+
+
+# ── ESTIMADORES ────────────────────────────────────
+def _indicadoras(m, grupo):
+    if grupo is None:
+        return pd.DataFrame({"total": np.ones(len(m.datos))}, index=m.datos.index)
+    return pd.get_dummies(m.datos[grupo], dtype=float)
+
+
+def _varianza_total(m, Z):
+    """Varianza del total estimado de cada columna de Z (valores por fila).
+
+    Z se suma por unidad y se aplica la fórmula del muestreo estratificado:
+    Σ_h N_h² (1 - n_h/N_h) s²_h / n_h, con s²_h entre unidades del estrato.
+    Las unidades sin filas del grupo cuentan como cero.
+    """
+    por_unidad = Z.groupby([m.datos["_estrato"].values, m.datos["_unidad"].values]).sum()
+    s1 = por_unidad.groupby(level=0).sum()
+    s2 = (por_unidad ** 2).groupby(level=0).sum()
+    N = m.diseno["N"].reindex(s1.index).values[:, None]
+    n = m.diseno["n"].reindex(s1.index).values[:, None]
+    s_cuad = np.where(n > 1, (s2 - s1 ** 2 / n) / np.maximum(n - 1, 1), 0.0)
+    return (N ** 2 * (1 - n / N) * s_cuad / n).sum(axis=0)
+
+
+def _tabla(estimacion, varianza, nombre="estimacion"):
+    error = Z_95 * np.sqrt(np.maximum(varianza, 0))
+    return pd.DataFrame({
+        nombre           : estimacion,
+        f"{nombre}_ic_inf": estimacion - error,
+        f"{nombre}_ic_sup": estimacion + error,
+    })
+
+
+def total(m, valor=None, grupo=None, nombre="total"):
+    """Total poblacional (o número de filas si `valor` es None) por grupo."""
+    Z = _indicadoras(m, grupo)
+    if valor is not None:
+        Z = Z.mul(m.datos[valor], axis=0)
+    estimacion = Z.mul(m.datos["_peso"], axis=0).sum()
+    return _tabla(estimacion, _varianza_total(m, Z), nombre)
+
+
+def media(m, valor, grupo=None, nombre="media"):
+    """Media poblacional por grupo como cociente de totales (linealizado)."""
+    X = _indicadoras(m, grupo)
+    Y = X.mul(m.datos[valor], axis=0)
+    peso = m.datos["_peso"]
+    tx = X.mul(peso, axis=0).sum()
+    ty = Y.mul(peso, axis=0).sum()
+    cociente = ty / tx
+    residuos = (Y - X.mul(cociente, axis=1)) / tx
+    return _tabla(cociente, _varianza_total(m, residuos), nombre)
+
+
+def cuantil(m, valor, p):
+    """Cuantil ponderado con intervalo de Woodruff.
+
+    Se estima la proporción acumulada en el cuantil y su error; los
+    extremos del intervalo de esa proporción se llevan de vuelta a precio.
+    """
+    x = m.datos[valor].to_numpy(float)
+    peso = m.datos["_peso"].to_numpy(float)
+    orden = np.argsort(x)
+    acumulado = np.cumsum(peso[orden]) / peso.sum()
+
+    def inversa(q):
+        return x[orden][np.searchsorted(acumulado, np.clip(q, 0, 1), side="left").clip(0, len(x) - 1)]
+
+    estimado = inversa(p)
+    m_ind = Muestra(m.datos.assign(_debajo=(x <= estimado).astype(float)), m.diseno)
+    error = media(m_ind, "_debajo").iloc[0]
+    ancho = (error["media_ic_sup"] - error["media_ic_inf"]) / 2
+    return estimado, inversa(p - ancho), inversa(p + ancho)
+
+
+def resumen(m, grupo, **agregados):
+    """Tabla por grupo con varios agregados y sus intervalos.
+
+    Cada agregado es (tipo, columna) con tipo "conteo", "total" o "media".
+    """
+    partes = []
+    for nombre, (tipo, valor) in agregados.items():
+        if tipo == "conteo":
+            partes.append(total(m, None, grupo, nombre))
+        elif tipo == "total":
+            partes.append(total(m, valor, grupo, nombre))
+        else:
+            partes.append(media(m, valor, grupo, nombre))
+    tabla = pd.concat(partes, axis=1)
+    if grupo is not None:
+        tabla.index.name = grupo
+    return tabla
@@ -0,0 +1,110 @@
+# src/puntuar_clientes.py
+# Puntuación por lotes de toda la base de clientes
+# Recorre el almacén de features en bloques de tamaño fijo, los reparte en
+# un pool de procesos y escribe una partición de resultados por bloque
+
+import pandas as pd
+import numpy as np
+import joblib
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from threadpoolctl import threadpool_limits
+from almacen_features import AlmacenFeatures, FEATURES, RUTA_ALMACEN
+
+# ── CONFIGURACIÓN ──────────────────────────────────
+TAMANO_LOTE   = int(os.environ.get("TAMANO_LOTE", 100_000))
+NUM_PROCESOS  = int(os.environ.get("NUM_PROCESOS", os.cpu_count() or 1))
+UMBRAL_RIESGO = 0.5
+
+RUTA_MODELOS = "data/models/modelos_clientes.joblib"
+DIR_SALIDA   = "data/outputs/puntuaciones"
+
+# Modelos y almacén abiertos una sola vez en cada proceso del pool
+_modelos = None
+_almacen = None
+
+
+def _iniciar_proceso(ruta_modelos, ruta_almacen):
+    global _modelos, _almacen
+    # Un hilo BLAS por proceso: el paralelismo viene del pool
+    threadpool_limits(1)
+    _modelos = joblib.load(ruta_modelos)
+    _almacen = AlmacenFeatures(ruta_almacen, modo="r")
+
+
+def puntuar_lote(numero, inicio, fin):
+    # Cada proceso lee su bloque directo del archivo mapeado en memoria
+    X = pd.DataFrame(_almacen.features(inicio, fin), columns=FEATURES)
+    seg = _modelos["segmentacion"]
+    X["segmento"] = seg["kmeans"].predict(seg["escalador"].transform(
+        np.nan_to_num(X[seg["features"]].to_numpy(np.float32))
+    ))
+    X = X[_modelos["features"]].fillna(0)
+
+    prob_volver = _modelos["modelo_recurrente"].predict_proba(
+        _modelos["scaler_recurrente"].transform(X)
+    )[:, 1]
+    prob_riesgo = _modelos["modelo_riesgo"].predict_proba(
+        _modelos["scaler_riesgo"].transform(X)
+    )[:, 1]
+
+    resultado = pd.DataFrame({
+        "cliente_id"            : _almacen.clientes()[inicio:fin],
+        "segmento"              : X["segmento"].values,
+        "prob_volver_a_comprar" : prob_volver.round(4),
+        "prob_no_volver"        : prob_riesgo.round(4),
+        "en_riesgo"             : (prob_riesgo > UMBRAL_RIESGO).astype(int),
+    })
+    resultado.to_csv(f"{DIR_SALIDA}/parte-{numero:05d}.csv", index=False)
+    return len(resultado), int(resultado["en_riesgo"].sum())
+
+
+if __name__ == "__main__":
+    os.makedirs(DIR_SALIDA, exist_ok=True)
+    for viejo in glob.glob(f"{DIR_SALIDA}/parte-*.csv"):
+        os.remove(viejo)
+
+    print("=" * 60)
+    print("  PUNTUACIÓN POR LOTES — Toda la base de clientes")
+    print(f"  Lote: {TAMANO_LOTE:,} clientes | Procesos: {NUM_PROCESOS}")
+    print("=" * 60)
+
+    total = AlmacenFeatures(RUTA_ALMACEN, modo="r").n_filas
+    bloques = range(0, total, TAMANO_LOTE)
+
+    inicio = time.perf_counter()
+    total_clientes, total_riesgo, particiones = 0, 0, 0
+
+    # Como máximo 2 lotes en vuelo por proceso: la memoria queda acotada
+    # sin importar el tamaño del perfil
+    max_pendientes = 2 * NUM_PROCESOS
+    pendientes = set()
+
+    def recoger(terminados):
+        global total_clientes, total_riesgo, particiones
+        for futuro in terminados:
+            n, riesgo = futuro.result()
+            total_clientes += n
+            total_riesgo   += riesgo
+            particiones    += 1
+
+    with ProcessPoolExecutor(
+        max_workers=NUM_PROCESOS,
+        initializer=_iniciar_proceso,
+        initargs=(RUTA_MODELOS, RUTA_ALMACEN),
+    ) as pool:
+        for numero, desde in enumerate(bloques):
+            if len(pendientes) >= max_pendientes:
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                recoger(terminados)
+            pendientes.add(pool.submit(puntuar_lote, numero, desde, desde + TAMANO_LOTE))
+        recoger(wait(pendientes).done)
+
+    segundos = time.perf_counter() - inicio
+    print(f"\n Clientes puntuados : {total_clientes:,}")
+    print(f" Clientes en riesgo : {total_riesgo:,}")
+    print(f" Particiones        : {particiones}")
+    print(f" Rendimiento        : {total_clientes / segundos:,.0f} clientes/s")
+    print(f"\n Resultados en {DIR_SALIDA}/parte-*.csv")
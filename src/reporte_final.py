@@ -6,7 +6,9 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
+import matplotlib.dates as mdates
 import os
+from resumen_reporte import series_tendencia, metricas_clave, VENTANA_MEDIA
 
 os.makedirs("data/outputs/graficas", exist_ok=True)
 
@@ -16,12 +18,13 @@ print("=" * 60)
 
 # ── CARGAR RESULTADOS ──────────────────────────────
 ventas        = pd.read_csv("data/processed/ventas_con_encoding.csv", parse_dates=["fecha_venta"])
-clientes      = pd.read_csv("data/raw/clientes.csv")
+clientes      = pd.read_csv("data/validated/clientes.csv")
 rentabilidad  = pd.read_csv("data/outputs/productos_rentables.csv")
 recurrentes   = pd.read_csv("data/outputs/clientes_recurrentes.csv")
 en_riesgo     = pd.read_csv("data/outputs/clientes_en_riesgo.csv")
 recomendacion = pd.read_csv("data/outputs/recomendaciones_producto.csv")
 prediccion    = pd.read_csv("data/outputs/prediccion_proxima_semana.csv")
+segmentos     = pd.read_csv("data/outputs/segmentos_clientes.csv")
 
 # ══════════════════════════════════════════════════
 # GRÁFICA 1 — Productos más rentables
@@ -44,25 +47,29 @@ plt.close()
 print(" Gráfica 1 generada")
 
 # ══════════════════════════════════════════════════
-# GRÁFICA 2 — Tendencia de ventas mensual
+# GRÁFICA 2 — Tendencia de ventas diaria
 # ══════════════════════════════════════════════════
-ventas["mes"] = ventas["fecha_venta"].dt.to_period("M").astype(str)
-tendencia = ventas.groupby("mes")["precio"].sum().reset_index()
+# Serie diaria reducida a PUNTOS_GRAFICA puntos: el costo de dibujar no
+# crece con los años de historial
+diaria, media_movil, total_dias = series_tendencia(ventas)
 
 fig, ax = plt.subplots(figsize=(12, 5))
-ax.plot(tendencia["mes"], tendencia["precio"],
-        marker="o", color="#3498db", linewidth=2)
-ax.fill_between(range(len(tendencia)), tendencia["precio"],
-                alpha=0.1, color="#3498db")
-ax.set_xticks(range(len(tendencia)))
-ax.set_xticklabels(tendencia["mes"], rotation=45, ha="right")
-ax.set_title(" Tendencia de Ventas Mensual", fontsize=14, fontweight="bold")
+ax.plot(diaria.index, diaria.values,
+        color="#3498db", linewidth=0.8, alpha=0.6, label="Ingreso diario")
+ax.fill_between(diaria.index, diaria.values, alpha=0.1, color="#3498db")
+ax.plot(media_movil.index, media_movil.values,
+        color="#e74c3c", linewidth=2, label=f"Media móvil {VENTANA_MEDIA} días")
+localizador = mdates.AutoDateLocator()
+ax.xaxis.set_major_locator(localizador)
+ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(localizador))
+ax.set_title(" Tendencia de Ventas Diaria", fontsize=14, fontweight="bold")
 ax.set_ylabel("Ingresos (S/.)")
 ax.grid(axis="y", linestyle="--", alpha=0.5)
+ax.legend()
 plt.tight_layout()
-plt.savefig("data/outputs/graficas/2_tendencia_mensual.png", dpi=150)
+plt.savefig("data/outputs/graficas/2_tendencia_ventas.png", dpi=150)
 plt.close()
-print(" Gráfica 2 generada")
+print(f" Gráfica 2 generada ({len(diaria):,} de {total_dias:,} días dibujados)")
 
 # ══════════════════════════════════════════════════
 # GRÁFICA 3 — Ventas por tipo de cliente
@@ -134,20 +141,7 @@ ax.text(0.5, 0.82, "— Resumen Ejecutivo —", ha="center",
         fontsize=11, color="#95a5a6", transform=ax.transAxes)
 
 # Métricas clave
-metricas = [
-    (" Ingresos Totales",
-     f"S/. {ventas['precio'].sum():,.0f}"),
-    (" Producto Estrella",
-     rentabilidad.iloc[0]["producto"]),
-    (" Total Clientes",
-     f"{ventas['cliente_id'].nunique():,}"),
-    ("  Clientes en Riesgo",
-     f"{len(en_riesgo)}"),
-    (" Predicción Próx. Semana",
-     f"S/. {prediccion.iloc[0]['ingreso_estimado']:,.0f}"),
-    (" Próximo Producto Top",
-     prediccion.iloc[0]["producto_mas_vendido"]),
-]
+metricas = metricas_clave(ventas, rentabilidad, en_riesgo, prediccion)
 
 x_pos = [0.1, 0.4, 0.7, 0.1, 0.4, 0.7]
 y_pos = [0.58, 0.58, 0.58, 0.28, 0.28, 0.28]
@@ -168,12 +162,41 @@ plt.savefig("data/outputs/graficas/5_resumen_ejecutivo.png",
 plt.close()
 print(" Gráfica 5 generada — Resumen ejecutivo")
 
+# ══════════════════════════════════════════════════
+# GRÁFICA 6 — Segmentos de clientes
+# ══════════════════════════════════════════════════
+fig, ax = plt.subplots(figsize=(9, 6))
+puntos = ax.scatter(
+    segmentos["compras_medias"],
+    segmentos["gasto_total_medio"],
+    s=segmentos["clientes"] / segmentos["clientes"].max() * 2000,
+    c=segmentos["dias_sin_comprar"],
+    cmap="RdYlGn_r", alpha=0.7, edgecolors="black"
+)
+for _, fila in segmentos.iterrows():
+    ax.annotate(
+        f"Segmento {int(fila['segmento'])}\n{int(fila['clientes']):,} clientes",
+        (fila["compras_medias"], fila["gasto_total_medio"]),
+        ha="center", va="center", fontsize=9, fontweight="bold"
+    )
+fig.colorbar(puntos, ax=ax, label="Días desde la última compra (media)")
+ax.set_title(" Segmentos de Clientes — Frecuencia vs Gasto", fontsize=14, fontweight="bold")
+ax.set_xlabel("Compras por cliente (media)")
+ax.set_ylabel("Gasto total por cliente (S/.)")
+ax.grid(linestyle="--", alpha=0.5)
+ax.margins(0.2)
+plt.tight_layout()
+plt.savefig("data/outputs/graficas/6_segmentos_clientes.png", dpi=150)
+plt.close()
+print(" Gráfica 6 generada")
+
 print("\n" + "=" * 60)
 print("   REPORTE FINAL COMPLETADO")
 print("  Gráficas en: data/outputs/graficas/")
 print("     1_productos_rentables.png")
-print("     2_tendencia_mensual.png")
+print("     2_tendencia_ventas.png")
 print("     3_ingresos_por_tipo.png")
 print("     4_clientes_potenciales.png")
 print("     5_resumen_ejecutivo.png")
+print("     6_segmentos_clientes.png")
 print("=" * 60)
\ No newline at end of file
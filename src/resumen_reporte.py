@@ -0,0 +1,111 @@
+# src/resumen_reporte.py
+# Datos compartidos por los reportes (PNG y tablero HTML)
+# Series diarias reducidas a un número fijo de puntos y métricas clave,
+# calculadas una sola vez para cualquier formato de salida
+
+import os
+import numpy as np
+
+# ── CONFIGURACIÓN ──────────────────────────────────
+# PUNTOS_GRAFICA: máximo de puntos por serie dibujada
+# METODO_SUBMUESTREO: "lttb"   → conserva la forma visual de la serie
+#                     "minmax" → conserva picos y valles de cada tramo
+PUNTOS_GRAFICA     = int(os.environ.get("PUNTOS_GRAFICA", 1000))
+METODO_SUBMUESTREO = os.environ.get("METODO_SUBMUESTREO", "lttb")
+VENTANA_MEDIA      = 7
+
+
+# ── SUBMUESTREO ────────────────────────────────────
+def lttb(x, y, puntos):
+    """Largest-Triangle-Three-Buckets: índices de los puntos a conservar.
+
+    Se mantienen el primero y el último; de cada tramo intermedio se elige
+    el punto que forma el triángulo de mayor área con el punto elegido en
+    el tramo anterior y la media del tramo siguiente.
+    """
+    n = len(y)
+    if puntos >= n or puntos < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    bordes = np.linspace(1, n - 1, puntos - 1).astype(int)
+    elegidos = np.empty(puntos, dtype=np.int64)
+    elegidos[0], elegidos[-1] = 0, n - 1
+
+    # Media de cada tramo (el último "tramo siguiente" es el punto final)
+    suma_x = np.add.reduceat(x[1:n - 1], bordes[:-1] - 1)
+    suma_y = np.add.reduceat(y[1:n - 1], bordes[:-1] - 1)
+    largo = np.diff(bordes)
+    media_x = np.append(suma_x / largo, x[-1])
+    media_y = np.append(suma_y / largo, y[-1])
+
+    a = 0
+    for i in range(puntos - 2):
+        ini, fin = bordes[i], bordes[i + 1]
+        area = np.abs(
+            (x[a] - media_x[i + 1]) * (y[ini:fin] - y[a])
+            - (x[a] - x[ini:fin]) * (media_y[i + 1] - y[a])
+        )
+        a = ini + int(np.argmax(area))
+        elegidos[i + 1] = a
+    return elegidos
+
+
+def min_max(y, puntos):
+    """Índices del mínimo y el máximo de cada tramo, en orden temporal."""
+    n = len(y)
+    if puntos >= n or puntos < 4:
+        return np.arange(n)
+    y = np.asarray(y, dtype=float)
+    # Primero y último fijos; el resto del presupuesto, dos puntos por tramo
+    bordes = np.linspace(1, n - 1, (puntos - 2) // 2 + 1).astype(int)
+    elegidos = [0]
+    for ini, fin in zip(bordes[:-1], bordes[1:]):
+        tramo = y[ini:fin]
+        elegidos += sorted({ini + int(np.argmin(tramo)), ini + int(np.argmax(tramo))})
+    elegidos.append(n - 1)
+    return np.array(elegidos)
+
+
+def reducir(serie, puntos=PUNTOS_GRAFICA, metodo=METODO_SUBMUESTREO):
+    """Serie con índice de fechas reducida a lo sumo a `puntos` valores."""
+    if metodo == "minmax":
+        idx = min_max(serie.values, puntos)
+    else:
+        dias = serie.index.values.astype("datetime64[s]").astype(np.int64) / 86_400
+        idx = lttb(dias, serie.values, puntos)
+    return serie.iloc[idx]
+
+
+# ── SERIES ─────────────────────────────────────────
+def serie_diaria(ventas, valor="precio"):
+    """Ingresos por día, con los días sin ventas en cero."""
+    diaria = ventas.set_index("fecha_venta")[valor].resample("D").sum()
+    return diaria.asfreq("D", fill_value=0.0)
+
+
+def series_tendencia(ventas):
+    """Ingresos diarios y su media móvil, ya reducidos para dibujar."""
+    diaria = serie_diaria(ventas)
+    media = diaria.rolling(VENTANA_MEDIA, min_periods=1).mean()
+    return reducir(diaria), reducir(media), len(diaria)
+
+
+# ── MÉTRICAS ───────────────────────────────────────
+def metricas_clave(ventas, rentabilidad, en_riesgo, prediccion):
+    """Pares (etiqueta, valor) del resumen ejecutivo."""
+    return [
+        (" Ingresos Totales",
+         f"S/. {ventas['precio'].sum():,.0f}"),
+        (" Producto Estrella",
+         rentabilidad.iloc[0]["producto"]),
+        (" Total Clientes",
+         f"{ventas['cliente_id'].nunique():,}"),
+        ("  Clientes en Riesgo",
+         f"{len(en_riesgo)}"),
+        (" Predicción Próx. Semana",
+         f"S/. {prediccion.iloc[0]['ingreso_estimado']:,.0f}"),
+        (" Próximo Producto Top",
+         prediccion.iloc[0]["producto_mas_vendido"]),
+    ]
@@ -0,0 +1,392 @@
+# src/stream_anomalias.py
+# Detección de precios atípicos en tiempo real
+# Lee ventas a medida que llegan (archivo en crecimiento o socket local)
+# y marca las sospechosas por cada par producto/marca
+
+import asyncio
+import csv
+import io
+import math
+import os
+import time
+import joblib
+import numpy as np
+import pandas as pd
+
+# ── CONFIGURACIÓN ──────────────────────────────────
+# MODO_STREAM: "archivo"  → sigue un CSV al que se le agregan ventas
+#              "socket"   → escucha líneas CSV en 127.0.0.1:PUERTO_EVENTOS
+#              "conciliar"→ reproduce el histórico y lo compara con el IQR batch
+MODO_STREAM    = os.environ.get("MODO_STREAM", "archivo")
+RUTA_EVENTOS   = os.environ.get("RUTA_EVENTOS", "data/raw/ventas.csv")
+PUERTO_EVENTOS = int(os.environ.get("PUERTO_EVENTOS", 9999))
+SEGUIR_ARCHIVO = os.environ.get("SEGUIR_ARCHIVO", "1") == "1"
+# REPROCESAR_EVENTOS=1 ignora el punto de control y relee el archivo desde
+# el inicio (reescribiendo las alertas)
+REPROCESAR     = os.environ.get("REPROCESAR_EVENTOS", "0") == "1"
+RUTA_ALERTAS   = "data/outputs/alertas_precios.csv"
+RUTA_PUNTO     = "data/models/stream_punto_control.joblib"
+INTERVALO_PUNTO = 1.0   # segundos entre puntos de control
+
+ALFA         = 0.02    # Peso exponencial (vida media ≈ 35 ventas por par)
+PASO_CUANTIL = 0.05    # Paso del estimador de cuantiles, en desviaciones
+FACTOR_IQR   = 1.5     # Mismo criterio que analisis_numpy.py
+MIN_EVENTOS  = 50      # Ventas por par antes de empezar a alertar
+MIN_RELATIVO = 0.01    # Piso del IQR y del paso, como fracción de la media
+ADAPTACION_MAX = 200   # Ventas para aceptar un cambio de precio (conciliar)
+UMBRAL_ACUERDO = float(os.environ.get("UMBRAL_ACUERDO", 0.99))  # conciliar
+TAMANO_BLOQUE = 1 << 16
+
+# Columnas de ventas.csv; una línea de encabezado en el stream las redefine
+COLUMNAS = ["venta_id", "cliente_id", "producto", "marca", "precio", "fecha_venta"]
+
+CABECERA_ALERTAS = "venta_id,producto,marca,precio,limite_inferior,limite_superior,zscore\n"
+
+
+class DetectorPrecios:
+    """Estado exponencial por (producto, marca): media, varianza y Q1/Q3.
+
+    Las primeras MIN_EVENTOS ventas de cada par se guardan en un buffer;
+    al llenarse, media, varianza y cuartiles arrancan de sus valores
+    exactos sobre ese buffer y el buffer se descarta. Desde ahí cada venta
+    actualiza su par en O(1): los cuartiles se siguen con un estimador
+    estocástico cuyo paso es proporcional a la desviación exponencial, así
+    que el umbral Q1/Q3 ± 1.5·IQR se adapta a cambios de precio sin guardar
+    historial. Una venta atípica actualiza el estado recortada al límite,
+    para que un precio erróneo no ensanche el rango.
+
+    El paso y el IQR tienen un piso de MIN_RELATIVO·media: con precios de
+    lista fijos la varianza llega a 0 y, sin piso, los cuartiles quedarían
+    congelados y todo cambio de precio se marcaría como atípico para siempre.
+    """
+
+    def __init__(self, alfa=ALFA, paso=PASO_CUANTIL, factor=FACTOR_IQR,
+                 min_eventos=MIN_EVENTOS, min_relativo=MIN_RELATIVO):
+        self.alfa = alfa
+        self.paso = paso
+        self.factor = factor
+        self.min_eventos = min_eventos
+        self.min_relativo = min_relativo
+        self.calentando = {}  # (producto, marca) → precios del calentamiento
+        self.estado = {}      # (producto, marca) → [n, media, varianza, q1, q3]
+
+    def procesar(self, producto, marca, precio):
+        """Devuelve (lim_inf, lim_sup, z) si la venta es atípica, si no None."""
+        par = (producto, marca)
+        est = self.estado.get(par)
+        if est is None:
+            buffer = self.calentando.setdefault(par, [])
+            buffer.append(precio)
+            if len(buffer) >= self.min_eventos:
+                precios = np.array(self.calentando.pop(par))
+                q1, q3 = np.percentile(precios, [25, 75])
+                self.estado[par] = [
+                    len(precios), float(precios.mean()), float(precios.var()),
+                    float(q1), float(q3),
+                ]
+            return None
+
+        n, media, var, q1, q3 = est
+        desv = math.sqrt(var)
+        piso = self.min_relativo * abs(media)
+
+        iqr = max(q3 - q1, piso)
+        lim_inf = q1 - self.factor * iqr
+        lim_sup = q3 + self.factor * iqr
+        alerta = None
+        if precio < lim_inf or precio > lim_sup:
+            z = (precio - media) / desv if desv > 0 else 0.0
+            alerta = (lim_inf, lim_sup, z)
+            precio = min(max(precio, lim_inf), lim_sup)
+
+        # Media y varianza exponenciales (forma incremental de West)
+        diff = precio - media
+        incr = self.alfa * diff
+        media += incr
+        var = (1 - self.alfa) * (var + diff * incr)
+
+        # Cuartiles: sube si la venta cae por encima, baja si cae por debajo
+        paso = self.paso * max(desv, piso)
+        q1 += paso * (0.25 - (precio < q1))
+        q3 += paso * (0.75 - (precio < q3))
+
+        est[0] = n + 1
+        est[1] = media
+        est[2] = var
+        est[3] = q1
+        est[4] = q3
+        return alerta
+
+
+class ProcesadorLineas:
+    """Convierte líneas CSV en eventos y escribe las alertas.
+
+    Con `reiniciar` el archivo de alertas se reescribe; si no, se agregan
+    al final (el detector retoma donde quedó la corrida anterior).
+    """
+
+    def __init__(self, detector, ruta_alertas=RUTA_ALERTAS, reiniciar=False,
+                 columnas=COLUMNAS):
+        self.detector = detector
+        self.indices(columnas)
+        self.eventos = 0
+        self.alertas = 0
+        self.segundos = 0.0  # tiempo de proceso, sin contar la espera de eventos
+        nuevo = reiniciar or not os.path.exists(ruta_alertas)
+        self.salida = open(ruta_alertas, "w" if nuevo else "a", encoding="utf-8", newline="")
+        if nuevo:
+            self.salida.write(CABECERA_ALERTAS)
+        self.escritor = csv.writer(self.salida, lineterminator="\n")
+
+    def indices(self, columnas):
+        self.columnas = list(columnas)
+        self.i_id = columnas.index("venta_id")
+        self.i_prod = columnas.index("producto")
+        self.i_marca = columnas.index("marca")
+        self.i_precio = columnas.index("precio")
+
+    def procesar(self, lineas):
+        inicio = time.perf_counter()
+        procesar = self.detector.procesar
+        i_id, i_prod, i_marca, i_precio = self.i_id, self.i_prod, self.i_marca, self.i_precio
+        salida = []
+        n = 0
+        # csv.reader respeta comillas ("Laptop 15"", gris") igual que pandas
+        for campos in csv.reader(lineas):
+            if not campos:
+                continue
+            if "venta_id" in campos and "precio" in campos:
+                # encabezado: puede traer otro orden de columnas
+                self.indices(campos)
+                i_id, i_prod, i_marca, i_precio = self.i_id, self.i_prod, self.i_marca, self.i_precio
+                continue
+            try:
+                precio = float(campos[i_precio])
+            except (ValueError, IndexError):
+                continue  # línea corrupta o incompleta
+            n += 1
+            alerta = procesar(campos[i_prod], campos[i_marca], precio)
+            if alerta is not None:
+                salida.append((
+                    campos[i_id], campos[i_prod], campos[i_marca], precio,
+                    f"{alerta[0]:.2f}", f"{alerta[1]:.2f}", f"{alerta[2]:.2f}",
+                ))
+        if salida:
+            self.escritor.writerows(salida)
+            self.salida.flush()
+        self.eventos += n
+        self.alertas += len(salida)
+        self.segundos += time.perf_counter() - inicio
+
+
+# ── PUNTO DE CONTROL ───────────────────────────────
+def cargar_punto(ruta):
+    """Punto de control de `ruta` (posición, columnas y detector) o None."""
+    if REPROCESAR or not os.path.exists(RUTA_PUNTO):
+        return None
+    punto = joblib.load(RUTA_PUNTO)
+    if punto["ruta"] != os.path.abspath(ruta) or os.path.getsize(ruta) < punto["posicion"]:
+        return None  # otro archivo, o el archivo se truncó/rotó
+    return punto
+
+
+def guardar_punto(ruta, posicion, procesador):
+    """Guarda hasta dónde se leyó y el estado del detector en ese punto."""
+    temporal = RUTA_PUNTO + ".tmp"
+    joblib.dump({
+        "ruta"      : os.path.abspath(ruta),
+        "posicion"  : posicion,
+        "columnas"  : procesador.columnas,
+        "estado"    : procesador.detector.estado,
+        "calentando": procesador.detector.calentando,
+    }, temporal)
+    os.replace(temporal, RUTA_PUNTO)
+
+
+# ── FUENTES DE EVENTOS ─────────────────────────────
+def fin_de_registro(datos):
+    """Posición tras el último salto de línea que no cae entre comillas."""
+    corte = datos.rfind(b"\n") + 1
+    while corte and datos.count(b'"', 0, corte) % 2:
+        corte = datos.rfind(b"\n", 0, corte - 1) + 1
+    return corte
+
+
+async def seguir_archivo(ruta, procesador, posicion=0):
+    """Lee el archivo por bloques desde `posicion`; al llegar al final
+    espera nuevas líneas.
+
+    Guarda el punto de control cada INTERVALO_PUNTO segundos, al quedar al
+    día y al salir: al reiniciar se retoma en la última línea procesada en
+    vez de repetir el histórico y sus alertas.
+    """
+    guardado = posicion
+    ultimo = time.monotonic()
+    with open(ruta, "rb") as f:
+        f.seek(posicion)
+        resto = b""
+        try:
+            while True:
+                bloque = f.read(TAMANO_BLOQUE)
+                if not bloque:
+                    if not SEGUIR_ARCHIVO:
+                        if resto:
+                            procesador.procesar([resto.decode("utf-8")])
+                            posicion += len(resto)
+                        return
+                    if posicion != guardado:
+                        guardar_punto(ruta, posicion, procesador)
+                        guardado = posicion
+                    await asyncio.sleep(0.2)
+                    continue
+                datos = resto + bloque
+                corte = fin_de_registro(datos)
+                resto = datos[corte:]
+                if corte:
+                    procesador.procesar(io.StringIO(datos[:corte].decode("utf-8")))
+                    posicion += corte
+                if time.monotonic() - ultimo >= INTERVALO_PUNTO:
+                    guardar_punto(ruta, posicion, procesador)
+                    guardado, ultimo = posicion, time.monotonic()
+        finally:
+            if posicion != guardado:
+                guardar_punto(ruta, posicion, procesador)
+
+
+async def escuchar_socket(puerto, procesador):
+    """Servidor TCP local: cada conexión envía líneas CSV de ventas."""
+    async def atender(reader, writer):
+        resto = b""
+        while True:
+            bloque = await reader.read(TAMANO_BLOQUE)
+            if not bloque:
+                break
+            datos = resto + bloque
+            corte = fin_de_registro(datos)
+            resto = datos[corte:]
+            procesador.procesar(io.StringIO(datos[:corte].decode("utf-8")))
+        procesador.procesar([resto.decode("utf-8")])
+        writer.close()
+
+    servidor = await asyncio.start_server(atender, "127.0.0.1", puerto)
+    print(f" Escuchando ventas en 127.0.0.1:{puerto}")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+# ── CONCILIACIÓN CON EL MÉTODO BATCH ───────────────
+def verificar_cambio_precio(precio=1999.0, nuevo=2099.0, ventas=5000):
+    """Un par con precio fijo que sube de lista debe dejar de alertar.
+
+    Devuelve cuántas ventas al nuevo precio tardó en aceptarse.
+    """
+    detector = DetectorPrecios()
+    for _ in range(MIN_EVENTOS + 10):
+        detector.procesar("prueba", "prueba", precio)
+    alertas = [detector.procesar("prueba", "prueba", nuevo) is not None
+               for _ in range(ventas)]
+    return max((i + 1 for i, a in enumerate(alertas) if a), default=0)
+
+
+def conciliar():
+    """Reproduce el histórico en orden y lo compara con el IQR batch."""
+    df = pd.read_csv("data/processed/ventas_procesadas.csv", parse_dates=["fecha_venta"])
+    df = df.sort_values("fecha_venta")
+
+    detector = DetectorPrecios()
+    inicio = time.perf_counter()
+    marcas_stream = np.array([
+        detector.procesar(p, m, x) is not None
+        for p, m, x in zip(df["producto"], df["marca"], df["precio"])
+    ])
+    segundos = time.perf_counter() - inicio
+
+    # IQR batch por par producto/marca (mismo criterio que el stream)
+    grupos = df.groupby(["producto", "marca"])["precio"]
+    q1 = grupos.transform(lambda x: np.percentile(x, 25)).values
+    q3 = grupos.transform(lambda x: np.percentile(x, 75)).values
+    iqr = q3 - q1
+    precios = df["precio"].values
+    marcas_par = (precios < q1 - FACTOR_IQR * iqr) | (precios > q3 + FACTOR_IQR * iqr)
+
+    # IQR batch global (analisis_numpy.py)
+    Q1, Q3 = np.percentile(precios, [25, 75])
+    marcas_global = (precios < Q1 - FACTOR_IQR * (Q3 - Q1)) | (precios > Q3 + FACTOR_IQR * (Q3 - Q1))
+
+    # Solo se comparan ventas con el par ya calentado en el stream
+    calentado = (df.groupby(["producto", "marca"]).cumcount() >= MIN_EVENTOS).values
+    ambos = (marcas_stream & marcas_par & calentado).sum()
+    acuerdo_par = (marcas_stream == marcas_par)[calentado].mean()
+    acuerdo_global = (marcas_stream == marcas_global)[calentado].mean()
+
+    print(f"   Ventas reproducidas          : {len(df):,}")
+    print(f"   Rendimiento                  : {len(df) / segundos:,.0f} eventos/s")
+    print(f"   Atípicos stream              : {marcas_stream.sum():,}")
+    print(f"   Atípicos IQR batch por par   : {marcas_par.sum():,} "
+          f"({(marcas_par & calentado).sum():,} tras calentamiento)")
+    print(f"   Atípicos IQR batch global    : {marcas_global.sum():,}")
+    print(f"   Coinciden stream y batch     : {ambos:,}")
+    print(f"   Solo stream / solo batch     : "
+          f"{(marcas_stream & ~marcas_par).sum():,} / "
+          f"{(marcas_par & calentado & ~marcas_stream).sum():,}")
+    print(f"   Acuerdo con IQR por par      : {acuerdo_par:.2%}")
+    print(f"   Acuerdo con IQR global       : {acuerdo_global:.2%}")
+
+    if acuerdo_par < UMBRAL_ACUERDO:
+        raise SystemExit(
+            f"   ERROR: acuerdo con el IQR batch {acuerdo_par:.2%} "
+            f"por debajo del umbral {UMBRAL_ACUERDO:.0%}"
+        )
+    print(f"   Stream y batch concilian (umbral {UMBRAL_ACUERDO:.0%})")
+
+    # Precio de lista fijo (varianza 0) que cambia: el par debe adaptarse
+    adaptacion = verificar_cambio_precio()
+    print(f"   Cambio de precio de lista    : aceptado tras {adaptacion} ventas")
+    if adaptacion > ADAPTACION_MAX:
+        raise SystemExit(
+            f"   ERROR: un cambio de precio de lista sigue alertando tras "
+            f"{adaptacion} ventas (máximo {ADAPTACION_MAX})"
+        )
+
+
+if __name__ == "__main__":
+    os.makedirs("data/outputs", exist_ok=True)
+
+    print("=" * 60)
+    print("  DETECCIÓN DE PRECIOS ATÍPICOS EN TIEMPO REAL")
+    print(f"  Modo: {MODO_STREAM}")
+    print("=" * 60)
+
+    if MODO_STREAM == "conciliar":
+        conciliar()
+    elif MODO_STREAM == "socket":
+        procesador = ProcesadorLineas(DetectorPrecios())
+        try:
+            asyncio.run(escuchar_socket(PUERTO_EVENTOS, procesador))
+        except KeyboardInterrupt:
+            pass
+    else:
+        os.makedirs(os.path.dirname(RUTA_PUNTO), exist_ok=True)
+        punto = cargar_punto(RUTA_EVENTOS)
+        detector = DetectorPrecios()
+        if punto is None:
+            procesador = ProcesadorLineas(detector, reiniciar=True)
+            posicion = 0
+            print(f" Siguiendo {RUTA_EVENTOS} desde el inicio")
+        else:
+            detector.estado = punto["estado"]
+            detector.calentando = punto["calentando"]
+            procesador = ProcesadorLineas(detector, columnas=punto["columnas"])
+            posicion = punto["posicion"]
+            print(f" Siguiendo {RUTA_EVENTOS} desde el byte {posicion:,} (punto de control)")
+        try:
+            asyncio.run(seguir_archivo(RUTA_EVENTOS, procesador, posicion))
+        except KeyboardInterrupt:
+            pass
+        procesador.salida.close()
+
+        print(f"\n Eventos procesados : {procesador.eventos:,}")
+        print(f" Alertas            : {procesador.alertas:,}")
+        print(f" Rendimiento        : "
+              f"{procesador.eventos / max(procesador.segundos, 1e-9):,.0f} eventos/s")
+        print(f" Alertas en {RUTA_ALERTAS}")
@@ -0,0 +1,234 @@
+# src/tablero_html.py
+# Tablero HTML estático del sistema
+# Alternativa liviana al reporte PNG: precalcula un JSON compacto con las
+# métricas y las series ya reducidas, y lo incrusta en una sola página
+# que se dibuja en el navegador (sin matplotlib ni dependencias externas)
+
+import json
+import math
+import os
+import time
+import pandas as pd
+from resumen_reporte import (
+    serie_diaria, series_tendencia, reducir, metricas_clave,
+    METODO_SUBMUESTREO, VENTANA_MEDIA
+)
+
+DIR_TABLERO = "data/outputs/tablero"
+
+
+def puntos(serie, decimales=2):
+    """Serie reducida como {fechas, valores} para el JSON."""
+    return {
+        "fechas" : serie.index.strftime("%Y-%m-%d").tolist(),
+        "valores": serie.round(decimales).tolist(),
+    }
+
+
+def sin_nan(valor):
+    """Reemplaza NaN por None (null) para que el JSON sea estándar."""
+    if isinstance(valor, dict):
+        return {k: sin_nan(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [sin_nan(v) for v in valor]
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    return valor
+
+
+PLANTILLA = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Sistema Inteligente de Análisis Comercial</title>
+<style>
+  body { margin: 0; font-family: system-ui, sans-serif; background: #f4f6f8; color: #2c3e50; }
+  header { background: #1a1a2e; color: white; padding: 20px 32px; }
+  header p { color: #95a5a6; margin: 4px 0 0; }
+  main { padding: 24px 32px; display: grid; gap: 24px; grid-template-columns: repeat(auto-fit, minmax(420px, 1fr)); }
+  section { background: white; border-radius: 8px; padding: 16px 20px; box-shadow: 0 1px 3px #0002; }
+  section.ancho { grid-column: 1 / -1; }
+  h2 { font-size: 16px; margin: 0 0 12px; }
+  .metricas { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 12px; }
+  .metrica span { display: block; font-size: 12px; color: #7f8c8d; }
+  .metrica b { font-size: 20px; color: #27ae60; }
+  table { border-collapse: collapse; width: 100%; font-size: 13px; }
+  th, td { text-align: right; padding: 4px 8px; border-bottom: 1px solid #ecf0f1; }
+  th:first-child, td:first-child { text-align: left; }
+  svg { width: 100%; height: auto; }
+  select { margin-bottom: 8px; }
+  .nota { font-size: 12px; color: #7f8c8d; }
+</style>
+</head>
+<body>
+<header>
+  <h1>SISTEMA INTELIGENTE DE ANÁLISIS COMERCIAL</h1>
+  <p>Resumen ejecutivo — generado el <span id="generado"></span></p>
+</header>
+<main>
+  <section class="ancho"><div class="metricas" id="metricas"></div></section>
+  <section class="ancho">
+    <h2>Tendencia de ventas diaria</h2>
+    <select id="serie"></select>
+    <div id="tendencia"></div>
+    <p class="nota" id="nota"></p>
+  </section>
+  <section><h2>Productos más rentables</h2><div id="productos"></div></section>
+  <section><h2>Ingresos por tipo de cliente</h2><div id="tipos"></div></section>
+  <section><h2>Predicción de ingresos</h2><table id="prediccion"></table></section>
+  <section><h2>Segmentos de clientes</h2><table id="segmentos"></table></section>
+  <section><h2>Clientes con mayor riesgo</h2><table id="riesgo"></table></section>
+</main>
+<script>
+const D = __DATOS__;
+const COLORES = ["#2ecc71", "#3498db", "#e74c3c", "#f39c12", "#9b59b6"];
+const soles = v => "S/. " + Math.round(v).toLocaleString("es-PE");
+const $ = id => document.getElementById(id);
+// Textos de los CSV del negocio: siempre escapados antes de ir a innerHTML
+const esc = v => String(v).replace(/[&<>"']/g, c =>
+  ({ "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" })[c]);
+const svg = (w, h, cuerpo) => `<svg viewBox="0 0 ${w} ${h}">${cuerpo}</svg>`;
+
+function lineas(series, w = 1100, h = 320) {
+  const m = { i: 70, d: 10, s: 10, b: 30 };
+  const xs = series.flatMap(s => s.fechas.map(f => Date.parse(f)));
+  const ys = series.flatMap(s => s.valores);
+  const x0 = Math.min(...xs), x1 = Math.max(...xs), y1 = Math.max(...ys) || 1;
+  const px = t => m.i + (t - x0) / (x1 - x0 || 1) * (w - m.i - m.d);
+  const py = v => h - m.b - v / y1 * (h - m.s - m.b);
+  let c = "";
+  for (let k = 0; k <= 4; k++) {
+    const v = y1 * k / 4;
+    c += `<line x1="${m.i}" x2="${w - m.d}" y1="${py(v)}" y2="${py(v)}" stroke="#ecf0f1"/>`;
+    c += `<text x="${m.i - 6}" y="${py(v) + 4}" font-size="11" text-anchor="end">${Math.round(v).toLocaleString("es-PE")}</text>`;
+  }
+  for (let k = 0; k <= 6; k++) {
+    const t = x0 + (x1 - x0) * k / 6;
+    c += `<text x="${px(t)}" y="${h - 8}" font-size="11" text-anchor="middle">${new Date(t).toISOString().slice(0, 7)}</text>`;
+  }
+  series.forEach(s => {
+    const p = s.fechas.map((f, j) => `${px(Date.parse(f)).toFixed(1)},${py(s.valores[j]).toFixed(1)}`).join(" ");
+    c += `<polyline points="${p}" fill="none" stroke="${s.color}" stroke-width="${s.grosor}"/>`;
+  });
+  return svg(w, h, c);
+}
+
+function barras(etiquetas, valores, w = 520) {
+  const alto = 28, max = Math.max(...valores);
+  let c = "";
+  etiquetas.forEach((e, j) => {
+    const y = j * alto, largo = valores[j] / max * (w - 260);
+    c += `<text x="0" y="${y + 18}" font-size="12">${esc(e)}</text>`;
+    c += `<rect x="130" y="${y + 5}" width="${largo}" height="18" fill="${COLORES[j % COLORES.length]}"/>`;
+    c += `<text x="${136 + largo}" y="${y + 18}" font-size="11">${soles(valores[j])}</text>`;
+  });
+  return svg(w, etiquetas.length * alto, c);
+}
+
+function tabla(id, columnas, filas) {
+  $(id).innerHTML = "<tr>" + columnas.map(c => `<th>${esc(c)}</th>`).join("") + "</tr>" +
+    filas.map(f => "<tr>" + f.map(v => `<td>${esc(v)}</td>`).join("") + "</tr>").join("");
+}
+
+function dibujarTendencia() {
+  const clave = $("serie").value;
+  const series = clave === "total"
+    ? [{ ...D.tendencia.diaria, color: "#3498db", grosor: 1 },
+       { ...D.tendencia.media, color: "#e74c3c", grosor: 2 }]
+    : [{ ...D.por_producto[clave], color: "#3498db", grosor: 1 }];
+  $("tendencia").innerHTML = lineas(series);
+}
+
+$("generado").textContent = D.generado;
+$("metricas").innerHTML = D.metricas.map(([e, v]) =>
+  `<div class="metrica"><span>${esc(e)}</span><b>${esc(v)}</b></div>`).join("");
+
+$("serie").innerHTML = `<option value="total">Total (con media móvil ${D.tendencia.ventana_media} días)</option>` +
+  Object.keys(D.por_producto).map(p => `<option value="${esc(p)}">${esc(p)}</option>`).join("");
+$("serie").onchange = dibujarTendencia;
+$("nota").textContent = `${D.tendencia.diaria.fechas.length.toLocaleString("es-PE")} de ` +
+  `${D.tendencia.dias.toLocaleString("es-PE")} días dibujados (${D.tendencia.metodo})`;
+dibujarTendencia();
+
+$("productos").innerHTML = barras(D.productos.producto, D.productos.ingresos);
+$("tipos").innerHTML = barras(Object.keys(D.tipos), Object.values(D.tipos));
+
+tabla("prediccion", ["Horizonte", "P10", "P50", "P90"],
+  D.prediccion.map(p => [`${p.horizonte_dias} días`, soles(p.ingreso_p10), soles(p.ingreso_p50), soles(p.ingreso_p90)]));
+tabla("segmentos", ["Segmento", "Clientes", "Gasto medio", "Compras", "Días sin comprar"],
+  D.segmentos.map(s => [s.segmento, s.clientes, soles(s.gasto_total_medio), s.compras_medias, Math.round(s.dias_sin_comprar)]));
+tabla("riesgo", ["Cliente", "Tipo", "Gasto total", "Días sin comprar", "Prob. no volver"],
+  D.riesgo.map(r => [r.cliente_id, r.tipo_cliente, soles(r.total_gastado), Math.round(r.dias_desde_ultima), (r.prob_no_volver * 100).toFixed(0) + "%"]));
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    inicio = time.perf_counter()
+    os.makedirs(DIR_TABLERO, exist_ok=True)
+
+    print("=" * 60)
+    print("  GENERANDO TABLERO HTML")
+    print("=" * 60)
+
+    # ── CARGAR RESULTADOS ──────────────────────────────
+    ventas = pd.read_csv(
+        "data/processed/ventas_con_encoding.csv",
+        usecols=["fecha_venta", "cliente_id", "producto", "tipo_cliente", "precio"],
+        parse_dates=["fecha_venta"],
+    )
+    rentabilidad = pd.read_csv("data/outputs/productos_rentables.csv")
+    en_riesgo    = pd.read_csv("data/outputs/clientes_en_riesgo.csv")
+    prediccion   = pd.read_csv("data/outputs/prediccion_proxima_semana.csv")
+    horizontes   = pd.read_csv("data/outputs/prediccion_horizontes.csv")
+    segmentos    = pd.read_csv("data/outputs/segmentos_clientes.csv")
+
+    # ── PRECALCULAR ────────────────────────────────────
+    diaria, media_movil, total_dias = series_tendencia(ventas)
+    por_producto = {
+        producto: puntos(reducir(serie_diaria(grupo)))
+        for producto, grupo in ventas.groupby("producto")
+    }
+
+    resumen = {
+        "generado" : pd.Timestamp.now().strftime("%Y-%m-%d %H:%M"),
+        "metricas" : metricas_clave(ventas, rentabilidad, en_riesgo, prediccion),
+        "tendencia": {
+            "diaria"       : puntos(diaria),
+            "media"        : puntos(media_movil),
+            "dias"         : total_dias,
+            "ventana_media": VENTANA_MEDIA,
+            "metodo"       : METODO_SUBMUESTREO,
+        },
+        "por_producto": por_producto,
+        "productos": {
+            "producto": rentabilidad["producto"].tolist(),
+            "ingresos": rentabilidad["total_ingresos"].round(2).tolist(),
+        },
+        "tipos"     : ventas.groupby("tipo_cliente")["precio"].sum().round(2).to_dict(),
+        "prediccion": horizontes.to_dict("records"),
+        "segmentos" : segmentos.to_dict("records"),
+        "riesgo"    : (
+            en_riesgo.sort_values("prob_no_volver", ascending=False)
+            .head(10).to_dict("records")
+        ),
+    }
+
+    # ── GUARDAR ────────────────────────────────────────
+    # allow_nan=False: un NaN que se escape falla aquí y no en quien lea el JSON
+    datos = json.dumps(sin_nan(resumen), ensure_ascii=False,
+                       separators=(",", ":"), allow_nan=False)
+    with open(f"{DIR_TABLERO}/resumen.json", "w", encoding="utf-8") as f:
+        f.write(datos)
+    # El JSON va incrustado: la página abre desde disco sin servidor.
+    # "</" se escapa para que un texto con "</script>" no cierre el bloque
+    with open(f"{DIR_TABLERO}/index.html", "w", encoding="utf-8") as f:
+        f.write(PLANTILLA.replace("__DATOS__", datos.replace("</", "<\\/")))
+
+    print(f" Series: {len(diaria):,} de {total_dias:,} días "
+          f"+ {len(por_producto)} productos")
+    print(f" resumen.json: {len(datos.encode('utf-8')) / 1024:,.1f} KB")
+    print(f" Tablero generado en {time.perf_counter() - inicio:.2f} s")
+    print(f"\n Abrir {DIR_TABLERO}/index.html en el navegador")
@@ -0,0 +1,245 @@
+# src/validar_datos.py
+# Validación de datos de entrada
+# Revisa esquema, rangos, unicidad e integridad referencial de las tablas
+# de data/raw/ antes del análisis. Las filas inválidas se ponen en
+# cuarentena y el resto sigue el pipeline desde data/validated/
+
+import pandas as pd
+import numpy as np
+import itertools
+import shutil
+import os
+import time
+
+os.makedirs("data/validated", exist_ok=True)
+os.makedirs("data/quarantine", exist_ok=True)
+
+# ── CATÁLOGOS DEL NEGOCIO ──────────────────────────
+# Ajustar a los valores reales del negocio (ver generar_datos.py)
+PRODUCTOS      = ["PC Gamer", "Laptop Oficina", "Servidor", "PC Básica", "Laptop Gamer"]
+TIPOS_CLIENTE  = ["particular", "empresa", "estudiante"]
+TIPOS_PROBLEMA = ["Hardware", "Software", "Red", "Sistema Operativo", "Otro"]
+
+ESQUEMAS = {
+    "clientes": ["cliente_id", "nombre", "ciudad", "tipo_cliente", "fecha_registro"],
+    "ventas"  : ["venta_id", "cliente_id", "producto", "marca", "precio", "fecha_venta"],
+    "tickets" : ["ticket_id", "cliente_id", "tipo_problema", "tecnico",
+                 "horas_resolucion", "resuelto", "fecha_ticket"],
+}
+
+# Texto con pocos valores distintos (catálogos y fechas): se lee como
+# categoría y las reglas revisan cada valor distinto una sola vez
+CATEGORIAS = {
+    "clientes": ["ciudad", "tipo_cliente", "fecha_registro"],
+    "ventas"  : ["producto", "marca", "fecha_venta"],
+    "tickets" : ["tipo_problema", "tecnico", "fecha_ticket"],
+}
+
+
+def cargar(tabla):
+    """Lee solo las columnas del esquema, sin convertir fechas; las
+    columnas numéricas con valores no numéricos quedan como texto y se
+    revisan con las reglas."""
+    ruta = f"data/raw/{tabla}.csv"
+    columnas = pd.read_csv(ruta, nrows=0).columns
+    faltantes = [c for c in ESQUEMAS[tabla] if c not in columnas]
+    if faltantes:
+        raise SystemExit(f" ERROR: {tabla}.csv no tiene las columnas {faltantes}")
+    return pd.read_csv(
+        ruta, usecols=ESQUEMAS[tabla], low_memory=False,
+        dtype={c: "category" for c in CATEGORIAS[tabla]},
+    )
+
+
+def numero(serie):
+    return pd.to_numeric(serie, errors="coerce").to_numpy(dtype=float)
+
+
+def por_valor(serie, prueba, si_vacio):
+    """Aplica `prueba` a cada valor distinto y lo expande a las filas."""
+    codigos, distintos = pd.factorize(serie)
+    resultado = prueba(np.asarray(distintos.astype(str)))
+    return np.append(resultado, si_vacio)[codigos]  # código -1: vacío
+
+
+def fecha_invalida(serie):
+    return por_valor(
+        serie,
+        lambda v: pd.isna(pd.to_datetime(v, format="ISO8601", errors="coerce")),
+        si_vacio=True,
+    )
+
+
+def en_catalogo(valores, catalogo):
+    """Pertenencia con búsqueda binaria sobre las claves ordenadas."""
+    catalogo = np.sort(np.asarray(catalogo))
+    if len(catalogo) == 0:
+        return np.zeros(len(valores), dtype=bool)
+    pos = np.searchsorted(catalogo, valores)
+    pos = np.minimum(pos, len(catalogo) - 1)
+    return catalogo[pos] == valores
+
+
+def texto_en_catalogo(serie, catalogo):
+    """Igual que en_catalogo, buscando solo los valores distintos."""
+    return por_valor(serie, lambda v: en_catalogo(v, catalogo), si_vacio=False)
+
+
+def id_invalido(serie):
+    ids = numero(serie)
+    return np.isnan(ids) | (ids != np.floor(ids)) | (ids <= 0)
+
+
+def separar(tabla, df, reglas):
+    """Aplica las reglas (nombre → máscara de filas inválidas) y separa.
+
+    Devuelve las filas válidas y un resumen compacto de las rechazadas:
+    número de fila en el CSV y motivos combinados con "|".
+    """
+    nombres = list(reglas)
+    codigo = np.zeros(len(df), dtype=np.int64)
+    for bit, nombre in enumerate(nombres):
+        codigo |= reglas[nombre].astype(np.int64) << bit
+
+    malas = codigo != 0
+    # Solo hay unas pocas combinaciones distintas: se traducen una vez
+    combinaciones, inversa = np.unique(codigo[malas], return_inverse=True)
+    textos = np.array([
+        "|".join(n for bit, n in enumerate(nombres) if c >> bit & 1)
+        for c in combinaciones
+    ], dtype=object)
+
+    rechazos = pd.DataFrame({
+        "tabla"  : tabla,
+        "fila"   : np.flatnonzero(malas) + 2,  # +1 encabezado, +1 base 1
+        "motivos": textos[inversa] if len(combinaciones) else np.array([], dtype=object),
+    })
+
+    guardar(tabla, df, malas, textos, inversa)
+
+    print(f"   {tabla:<9}: {len(df):>10,} filas | {malas.sum():>8,} rechazadas")
+    for nombre in nombres:
+        n = int(reglas[nombre].sum())
+        if n:
+            print(f"      - {nombre:<22} {n:,}")
+    return df[~malas], rechazos
+
+
+def salto_entre_comillas(contenido):
+    """True si algún salto de línea cae dentro de un campo entre comillas
+    (hay un número impar de comillas antes que él)."""
+    if b'"' not in contenido:
+        return False
+    bytes_ = np.frombuffer(contenido, dtype=np.uint8)
+    comillas = np.flatnonzero(bytes_ == ord('"'))
+    saltos = np.flatnonzero(bytes_ == ord("\n"))
+    return bool((np.searchsorted(comillas, saltos) % 2).any())
+
+
+def lineas_por_fila(ruta, n_filas):
+    """Líneas del CSV original: el encabezado y una por fila leída.
+
+    Devuelve None si no se pueden alinear con las filas de pandas: algún
+    campo entre comillas trae un salto de línea (la fila ocupa varias
+    líneas) o los conteos no coinciden. Las líneas en blanco, que pandas
+    salta, se descartan.
+    """
+    with open(ruta, "rb") as f:
+        contenido = f.read()
+    if salto_entre_comillas(contenido):
+        return None
+    # Sin campos multilínea, cada línea no vacía es una fila
+    lineas = contenido.splitlines(keepends=True)
+    if len(lineas) != n_filas + 1:
+        lineas = [linea for linea in lineas if linea.strip()]
+    return lineas if len(lineas) == n_filas + 1 else None
+
+
+def guardar(tabla, df, malas, textos, inversa):
+    """Copia las líneas originales de las filas válidas a data/validated/ y
+    las de las rechazadas, con sus motivos, a data/quarantine/.
+
+    Copiar líneas es mucho más rápido que volver a serializar con pandas
+    y conserva el formato original del archivo. Si las líneas no se pueden
+    alinear con las filas, se escribe vía pandas.
+    """
+    origen = f"data/raw/{tabla}.csv"
+    validas = f"data/validated/{tabla}.csv"
+    cuarentena = f"data/quarantine/{tabla}.csv"
+    lineas = lineas_por_fila(origen, len(df)) if malas.any() else None
+
+    if lineas is None:
+        if malas.any():
+            df[~malas].to_csv(validas, index=False)
+        else:
+            shutil.copyfile(origen, validas)
+        rechazadas = df[malas].copy()
+        rechazadas["motivos"] = textos[inversa] if len(textos) else []
+        rechazadas.to_csv(cuarentena, index=False)
+        return
+
+    with open(validas, "wb") as f:
+        f.write(lineas[0])
+        f.writelines(itertools.compress(lineas[1:], ~malas))
+    motivos = [t.encode() for t in textos]
+    with open(cuarentena, "wb") as f:
+        f.write(lineas[0].rstrip(b"\r\n") + b",motivos\n")
+        f.writelines(
+            linea.rstrip(b"\r\n") + b"," + motivos[i] + b"\n"
+            for linea, i in zip(itertools.compress(lineas[1:], malas), inversa)
+        )
+
+
+print("=" * 60)
+print("  VALIDACIÓN DE DATOS DE ENTRADA")
+print("=" * 60)
+
+inicio = time.perf_counter()
+clientes = cargar("clientes")
+ventas   = cargar("ventas")
+tickets  = cargar("tickets")
+
+# ── CLIENTES ───────────────────────────────────────
+print("\n Validando tablas...")
+clientes_ok, rech_clientes = separar("clientes", clientes, {
+    "id_invalido"          : id_invalido(clientes["cliente_id"]),
+    "id_duplicado"         : clientes["cliente_id"].duplicated().to_numpy(),
+    "tipo_desconocido"     : ~texto_en_catalogo(clientes["tipo_cliente"], TIPOS_CLIENTE),
+    "fecha_invalida"       : fecha_invalida(clientes["fecha_registro"]),
+})
+
+# Claves válidas ordenadas para la integridad referencial
+claves_cliente = np.unique(numero(clientes_ok["cliente_id"]))
+
+# ── VENTAS ─────────────────────────────────────────
+precio = numero(ventas["precio"])
+ventas_ok, rech_ventas = separar("ventas", ventas, {
+    "id_invalido"          : id_invalido(ventas["venta_id"]),
+    "id_duplicado"         : ventas["venta_id"].duplicated().to_numpy(),
+    "cliente_inexistente"  : ~en_catalogo(numero(ventas["cliente_id"]), claves_cliente),
+    "producto_desconocido" : ~texto_en_catalogo(ventas["producto"], PRODUCTOS),
+    "precio_no_numerico"   : np.isnan(precio),
+    "precio_no_positivo"   : precio <= 0,
+    "fecha_invalida"       : fecha_invalida(ventas["fecha_venta"]),
+})
+
+# ── TICKETS ────────────────────────────────────────
+horas = numero(tickets["horas_resolucion"])
+resuelto = numero(tickets["resuelto"])
+tickets_ok, rech_tickets = separar("tickets", tickets, {
+    "id_invalido"          : id_invalido(tickets["ticket_id"]),
+    "id_duplicado"         : tickets["ticket_id"].duplicated().to_numpy(),
+    "cliente_inexistente"  : ~en_catalogo(numero(tickets["cliente_id"]), claves_cliente),
+    "problema_desconocido" : ~texto_en_catalogo(tickets["tipo_problema"], TIPOS_PROBLEMA),
+    "horas_invalidas"      : ~(horas >= 0),
+    "resuelto_invalido"    : ~((resuelto == 0) | (resuelto == 1)),
+    "fecha_invalida"       : fecha_invalida(tickets["fecha_ticket"]),
+})
+
+# ── GUARDAR ────────────────────────────────────────
+rechazos = pd.concat([rech_clientes, rech_ventas, rech_tickets], ignore_index=True)
+rechazos.to_csv("data/quarantine/rechazos.csv", index=False)
+
+print(f"\n Validación completada en {time.perf_counter() - inicio:.2f} s")
+print(f"   Filas rechazadas: {len(rechazos):,} (detalle en data/quarantine/rechazos.csv)")
+print(" Datos válidos guardados en data/validated/")